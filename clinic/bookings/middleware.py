@@ -1,9 +1,38 @@
+import logging
+
 from django.contrib.auth.models import User
 from django.contrib import messages
 from django.http import HttpResponseForbidden
 from django.shortcuts import redirect
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
+
+class ActivityLogBufferMiddleware:
+    """
+    Buffer ActivityLog rows created during a request and flush them with a
+    single bulk_create on response, so an action that logs several audit
+    entries costs one INSERT batch instead of one INSERT per entry.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request._activity_buffer = []
+        response = self.get_response(request)
+        buffer = getattr(request, '_activity_buffer', None)
+        if buffer:
+            from .models import ActivityLog
+            try:
+                ActivityLog.objects.bulk_create(
+                    buffer, batch_size=500, ignore_conflicts=True
+                )
+            except Exception as e:
+                logger.error(f"Failed to flush activity log buffer: {str(e)}", exc_info=True)
+        return response
+
+
 class StaffPermissionMiddleware:
     """
     Middleware to enforce staff permission restrictions using configurable paths
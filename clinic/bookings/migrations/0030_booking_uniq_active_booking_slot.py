@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0029_migrate_blocked_dates_to_calendar'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'Cancelled'), _negated=True), fields=('date', 'time'), name='uniq_active_booking_slot'),
+        ),
+    ]
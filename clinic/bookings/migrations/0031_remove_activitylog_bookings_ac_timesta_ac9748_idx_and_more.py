@@ -0,0 +1,58 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0030_booking_uniq_active_booking_slot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='activitylog',
+            name='bookings_ac_timesta_ac9748_idx',
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['-timestamp', 'id'], name='bookings_ac_timesta_4404cb_idx'),
+        ),
+        # The descending ordering-aligned indexes below serve the old
+        # ascending twins' lookups via equality prefixes and backward
+        # scans, so those are dropped rather than kept alongside
+        migrations.RemoveIndex(
+            model_name='billing',
+            name='bookings_bi_is_paid_6bd373_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='bookings_bo_date_9ed98b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='bookings_bo_status_c5c45f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='billing',
+            index=models.Index(fields=['is_paid', '-issued_date'], name='bookings_bi_is_paid_de6957_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='billing',
+            index=models.Index(fields=['-issued_date', 'id'], name='bookings_bi_issued__f8ed60_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['-date', '-time', 'status'], name='bookings_bo_date_244edd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', '-date', '-time'], name='bookings_bo_status_cefe3c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['billing', '-payment_date'], name='bookings_pa_billing_917e9c_idx'),
+        ),
+    ]
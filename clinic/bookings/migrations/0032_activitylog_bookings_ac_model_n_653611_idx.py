@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0031_remove_activitylog_bookings_ac_timesta_ac9748_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['model_name', 'object_id'], name='bookings_ac_model_n_653611_idx'),
+        ),
+    ]
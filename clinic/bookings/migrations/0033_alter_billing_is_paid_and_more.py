@@ -0,0 +1,43 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0032_activitylog_bookings_ac_model_n_653611_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='billing',
+            name='is_paid',
+            field=models.BooleanField(default=False, help_text='Automatically updated when payments cover total'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='consultation_status',
+            field=models.CharField(choices=[('Not Yet', 'Not Yet'), ('Ongoing', 'Ongoing'), ('Done', 'Done'), ('No-Show', 'No-Show')], default='Not Yet', help_text='Track consultation progress', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='status',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Confirmed', 'Confirmed'), ('Completed', 'Completed'), ('Cancelled', 'Cancelled')], default='Pending', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='calendar',
+            name='event_type',
+            field=models.CharField(choices=[('blocked', 'Blocked Date'), ('holiday', 'Holiday'), ('special_hours', 'Special Operating Hours')], default='blocked', help_text='Type of calendar event', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(condition=models.Q(('action__in', ['CREATE', 'UPDATE', 'DELETE'])), fields=['-timestamp'], name='al_write_ops'),
+        ),
+        migrations.AddIndex(
+            model_name='billing',
+            index=models.Index(condition=models.Q(('is_paid', False)), fields=['-issued_date'], name='bill_unpaid_recent'),
+        ),
+    ]
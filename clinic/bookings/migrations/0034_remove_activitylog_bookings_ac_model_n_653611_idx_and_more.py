@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0033_alter_billing_is_paid_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='activitylog',
+            name='bookings_ac_model_n_653611_idx',
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['model_name', 'object_id', '-timestamp'], name='al_obj_trail'),
+        ),
+    ]
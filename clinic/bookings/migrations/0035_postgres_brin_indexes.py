@@ -0,0 +1,43 @@
+# Postgres-only BRIN indexes for the append-only timestamp columns.
+#
+# ActivityLog.timestamp, Booking.created_at and Billing.issued_date are
+# monotonically increasing, which is the ideal BRIN case: the index is
+# orders of magnitude smaller than a B-tree, supports the same range
+# scans, and costs almost nothing to maintain on insert. SQLite has no
+# BRIN support, so the operations are vendor-guarded no-ops there.
+
+from django.db import migrations
+
+BRIN_INDEXES = [
+    ('al_timestamp_brin', 'bookings_activitylog', 'timestamp'),
+    ('bk_created_at_brin', 'bookings_booking', 'created_at'),
+    ('bill_issued_brin', 'bookings_billing', 'issued_date'),
+]
+
+
+def add_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in BRIN_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING brin ({column}) WITH (pages_per_range = 32)'
+        )
+
+
+def drop_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in BRIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0034_remove_activitylog_bookings_ac_model_n_653611_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_brin_indexes, drop_brin_indexes),
+    ]
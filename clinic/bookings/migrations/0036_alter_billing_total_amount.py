@@ -0,0 +1,27 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:16
+#
+# Hand-edited: GeneratedField definitions cannot be altered in place, so the
+# column is dropped and re-added as GENERATED ALWAYS ... STORED. The database
+# recomputes every total from the fee columns, so no data backfill is needed.
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0035_postgres_brin_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='billing',
+            name='total_amount',
+        ),
+        migrations.AddField(
+            model_name='billing',
+            name='total_amount',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('service_fee'), '+', models.F('medicine_fee')), '+', models.F('additional_fee')), '-', models.F('discount')), help_text='Total amount (computed by the database)', output_field=models.DecimalField(decimal_places=2, max_digits=10)),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:17
+#
+# Hand-edited: truncate any overlong rows before shrinking the columns so
+# the ALTER cannot fail on Postgres.
+
+import logging
+
+from django.db import migrations, models
+from django.db.models.functions import Length
+
+logger = logging.getLogger(__name__)
+
+TRUNCATED_FIELDS = [
+    ('Billing', ['notes']),
+    ('Booking', ['notes', 'cancellation_reason']),
+    ('Doctor', ['schedule_notes']),
+]
+
+
+def truncate_overlong_rows(apps, schema_editor):
+    for model_name, fields in TRUNCATED_FIELDS:
+        model = apps.get_model('bookings', model_name)
+        for field in fields:
+            overlong = model.objects.annotate(
+                _len=Length(field)
+            ).filter(_len__gt=1024)
+            for obj in overlong:
+                logger.warning(
+                    f"Truncating {model_name}.{field} for pk={obj.pk} "
+                    f"({len(getattr(obj, field))} chars)"
+                )
+                setattr(obj, field, getattr(obj, field)[:1024])
+                obj.save(update_fields=[field])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0036_alter_billing_total_amount'),
+    ]
+
+    operations = [
+        migrations.RunPython(truncate_overlong_rows, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='billing',
+            name='notes',
+            field=models.CharField(blank=True, help_text='Billing notes', max_length=1024),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='cancellation_reason',
+            field=models.CharField(blank=True, help_text='Reason for cancellation', max_length=1024),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='notes',
+            field=models.CharField(blank=True, help_text='Additional notes or special requests', max_length=1024),
+        ),
+        migrations.AlterField(
+            model_name='doctor',
+            name='schedule_notes',
+            field=models.CharField(blank=True, help_text='Working hours and availability notes', max_length=1024),
+        ),
+    ]
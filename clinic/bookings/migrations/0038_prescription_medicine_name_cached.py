@@ -0,0 +1,42 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:23
+#
+# Hand-edited: backfill the denormalized name for existing rows with two
+# set-based UPDATEs (no per-row saves).
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+
+
+def backfill_medicine_name(apps, schema_editor):
+    Prescription = apps.get_model('bookings', 'Prescription')
+    Inventory = apps.get_model('bookings', 'Inventory')
+
+    # Custom-named medicines copy their own column
+    Prescription.objects.exclude(custom_medicine_name='').update(
+        medicine_name_cached=F('custom_medicine_name')
+    )
+
+    # Inventory-backed medicines pull the name via a correlated subquery
+    Prescription.objects.filter(
+        medicine_name_cached='', medicine__isnull=False
+    ).update(
+        medicine_name_cached=Subquery(
+            Inventory.objects.filter(pk=OuterRef('medicine_id')).values('name')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0037_alter_billing_notes_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='prescription',
+            name='medicine_name_cached',
+            field=models.CharField(blank=True, editable=False, help_text='Cached medicine name for display without a join', max_length=255),
+        ),
+        migrations.RunPython(backfill_medicine_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Hand-written: create the inventory_lowstock SQL view backing the
+# unmanaged LowStockView model. A plain view (not materialized) stays
+# current without a refresh job and works on both SQLite and Postgres.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0038_prescription_medicine_name_cached'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE VIEW inventory_lowstock AS "
+                "SELECT item_id, name, category, quantity, stock "
+                "FROM bookings_inventory WHERE quantity <= stock"
+            ),
+            reverse_sql="DROP VIEW inventory_lowstock",
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0039_inventory_lowstock_view'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LowStockView',
+            fields=[
+                ('item_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('category', models.CharField(max_length=20)),
+                ('quantity', models.IntegerField()),
+                ('stock', models.IntegerField()),
+            ],
+            options={
+                'verbose_name': 'Low Stock Item',
+                'verbose_name_plural': 'Low Stock Items',
+                'db_table': 'inventory_lowstock',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0040_lowstockview'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='possale',
+            name='receipt_number',
+            field=models.CharField(editable=False, help_text='Auto-generated receipt number (derived from the primary key)', max_length=50, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0041_alter_possale_receipt_number'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='possaleitem',
+            index=models.Index(fields=['sale', 'id'], name='bookings_po_sale_id_7cd895_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='prescription',
+            index=models.Index(fields=['medical_record', '-prescribed_date'], name='bookings_pr_medical_c9a1f8_idx'),
+        ),
+    ]
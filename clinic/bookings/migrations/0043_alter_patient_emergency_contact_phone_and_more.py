@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:30
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0042_possaleitem_bookings_po_sale_id_7cd895_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='patient',
+            name='emergency_contact_phone',
+            field=models.CharField(blank=True, max_length=17, validators=[django.core.validators.RegexValidator(message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.", regex=re.compile('^\\+?1?\\d{9,15}$'))]),
+        ),
+        migrations.AlterField(
+            model_name='patient',
+            name='phone',
+            field=models.CharField(blank=True, help_text="Patient's primary phone number (must be unique)", max_length=17, null=True, unique=True, validators=[django.core.validators.RegexValidator(message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.", regex=re.compile('^\\+?1?\\d{9,15}$'))]),
+        ),
+    ]
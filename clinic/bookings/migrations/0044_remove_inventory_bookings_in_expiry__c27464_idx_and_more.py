@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0043_alter_patient_emergency_contact_phone_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='inventory',
+            name='bookings_in_expiry__c27464_idx',
+        ),
+        migrations.AddIndex(
+            model_name='inventory',
+            index=models.Index(condition=models.Q(('category', 'Medicine'), ('expiry_date__isnull', False)), fields=['expiry_date'], name='inv_medicine_expiry_idx'),
+        ),
+    ]
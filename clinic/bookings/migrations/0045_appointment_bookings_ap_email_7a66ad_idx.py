@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0044_remove_inventory_bookings_in_expiry__c27464_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['email', 'date', 'time'], name='bookings_ap_email_7a66ad_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0045_appointment_bookings_ap_email_7a66ad_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='medicalrecord',
+            name='booking',
+            field=models.ForeignKey(blank=True, help_text='Booking this record was created from (direct link for billing lookups)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='medical_records', to='bookings.booking'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-29 19:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0046_medicalrecord_booking'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['patient_email', 'status', '-date', '-time'], name='bk_email_status_dt_idx'),
+        ),
+    ]
@@ -27,7 +27,7 @@ from .patients import Patient, MedicalRecord, MedicalImage, medical_image_upload
 from .billing import Billing, Payment
 
 # Inventory models
-from .inventory import Inventory, StockTransaction
+from .inventory import Inventory, StockTransaction, LowStockView
 
 # Activity logging
 from .activity_log import ActivityLog
@@ -36,7 +36,7 @@ from .activity_log import ActivityLog
 from .prescriptions import Prescription
 
 # Point of Sale models
-from .pos import POSSale, POSSaleItem
+from .pos import POSSale, POSSaleItem, STOCK_TXN_BATCH
 
 __all__ = [
     # Base
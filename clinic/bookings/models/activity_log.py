@@ -33,9 +33,22 @@ class ActivityLog(models.Model):
     class Meta:
         ordering = ['-timestamp']
         indexes = [
-            models.Index(fields=['-timestamp']),
+            # id tiebreaker keeps the ordering fully index-resolvable
+            models.Index(fields=['-timestamp', 'id']),
             models.Index(fields=['user', '-timestamp']),
             models.Index(fields=['model_name', '-timestamp']),
+            # "Audit trail for object X" becomes a single ordered index
+            # range scan instead of a filter + sort
+            models.Index(
+                fields=['model_name', 'object_id', '-timestamp'],
+                name='al_obj_trail',
+            ),
+            # Partial index for the audit screens that only show write actions
+            models.Index(
+                fields=['-timestamp'],
+                condition=models.Q(action__in=['CREATE', 'UPDATE', 'DELETE']),
+                name='al_write_ops',
+            ),
         ]
     
     def __str__(self):
@@ -2,8 +2,10 @@
 Appointment and booking models
 Handles appointment scheduling and booking management
 """
-from django.db import models
+from django.db import IntegrityError, models
+from django.db.models import Q
 from django.contrib.auth.models import User
+from django.utils.functional import cached_property
 
 from .base import Service
 from .doctors import Doctor
@@ -38,16 +40,42 @@ class Appointment(models.Model):
         ('No-Show', 'No-Show'),
     ]
     consultation_status = models.CharField(
-        max_length=10, 
-        choices=CONSULTATION_STATUS_CHOICES, 
+        max_length=10,
+        choices=CONSULTATION_STATUS_CHOICES,
         default='Not Yet',
         help_text="Track consultation progress"
     )
-    
+
+    class Meta:
+        indexes = [
+            # Natural-key lookup used by the booking-confirmation signal
+            models.Index(fields=['email', 'date', 'time']),
+        ]
+
     def __str__(self):
         return f"{self.name} - {self.date} {self.time}"
 
 
+class BookingQuerySet(models.QuerySet):
+    """Custom queryset for Booking list-page reads"""
+
+    def for_list_view(self):
+        """
+        Pre-join the FKs rendered in list rows (including the reverse
+        one-to-one to Billing for Paid?/Balance columns) and skip the text
+        blobs the list templates never show, so a page renders from one
+        query with smaller rows. notes stays loaded — the list partials
+        render it.
+        """
+        return self.select_related(
+            'service', 'created_by', 'cancelled_by', 'billing'
+        ).defer(
+            'cancellation_reason',
+            'service__description',
+            'service__image',
+        )
+
+
 class Booking(models.Model):
     """Patient booking/appointment with automatic billing generation"""
     
@@ -87,20 +115,25 @@ class Booking(models.Model):
         help_text="Assigned doctor for this appointment",
         related_name='bookings'
     )
+    # No db_index on the status fields: 3-10 distinct values make a
+    # single-column B-tree useless to the planner, and the composite
+    # indexes in Meta cover the status-filtered queries
     status = models.CharField(
-        max_length=20, 
-        choices=STATUS_CHOICES, 
-        default='Pending', 
-        db_index=True
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='Pending'
     )
     consultation_status = models.CharField(
-        max_length=10, 
-        choices=CONSULTATION_STATUS_CHOICES, 
+        max_length=10,
+        choices=CONSULTATION_STATUS_CHOICES,
         default='Not Yet',
-        help_text="Track consultation progress",
-        db_index=True
+        help_text="Track consultation progress"
+    )
+    notes = models.CharField(
+        max_length=1024,
+        blank=True,
+        help_text="Additional notes or special requests"
     )
-    notes = models.TextField(blank=True, help_text="Additional notes or special requests")
     
     # System Fields
     created_at = models.DateTimeField(auto_now_add=True)
@@ -124,43 +157,46 @@ class Booking(models.Model):
         related_name='cancelled_bookings',
         help_text="User who cancelled this booking"
     )
-    cancellation_reason = models.TextField(
+    cancellation_reason = models.CharField(
+        max_length=1024,
         blank=True,
         help_text="Reason for cancellation"
     )
-    
+
+    objects = BookingQuerySet.as_manager()
+
     class Meta:
         ordering = ['-date', '-time']
         verbose_name = 'Booking'
         verbose_name_plural = 'Bookings'
-        # Add compound index for common date+time queries
         indexes = [
-            models.Index(fields=['date', 'time']),
-            models.Index(fields=['status', 'date']),
+            # Match Meta.ordering so list pages read the first page straight
+            # off the index instead of sorting the whole table; these also
+            # serve plain (date, time) and (status, date) lookups via
+            # equality prefixes and backward scans, so the old ascending
+            # twins are gone
+            models.Index(fields=['-date', '-time', 'status']),
+            models.Index(fields=['status', '-date', '-time']),
+            # Covers the prescription signals' fallback scan for a
+            # patient's most recent active booking by email
+            models.Index(fields=['patient_email', 'status', '-date', '-time'],
+                         name='bk_email_status_dt_idx'),
         ]
-    
+        # Enforce one active booking per slot at the database level so the
+        # write path doesn't need a pre-save EXISTS query (which was also a
+        # check-then-insert race under concurrent bookings)
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'time'],
+                condition=~Q(status='Cancelled'),
+                name='uniq_active_booking_slot',
+            ),
+        ]
+
     def clean(self):
-        """Validate booking to prevent double-booking"""
+        """Validate doctor availability (slot uniqueness is enforced by the DB constraint)"""
         from django.core.exceptions import ValidationError
-        
-        # Check for existing bookings at the same date/time (excluding cancelled)
-        existing = Booking.objects.filter(
-            date=self.date,
-            time=self.time
-        ).exclude(
-            status='Cancelled'
-        )
-        
-        # Exclude self if updating
-        if self.pk:
-            existing = existing.exclude(pk=self.pk)
-        
-        if existing.exists():
-            raise ValidationError(
-                f"A booking already exists for {self.date} at {self.time}. "
-                f"Please choose a different time slot."
-            )
-        
+
         # Check if doctor is already booked at this time
         if self.doctor:
             doctor_bookings = Booking.objects.filter(
@@ -182,15 +218,54 @@ class Booking(models.Model):
                 )
     
     def save(self, *args, **kwargs):
-        """Override save to call clean()"""
-        self.clean()
-        super().save(*args, **kwargs)
+        """Save the booking, translating slot-collision errors from the DB constraint"""
+        from django.core.exceptions import ValidationError
+        from django.db import transaction
+
+        try:
+            # The savepoint lets callers catch the translated error and
+            # keep querying; without it the IntegrityError poisons the
+            # enclosing transaction on Postgres
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as exc:
+            # Postgres reports the constraint name; SQLite only names the
+            # columns ("UNIQUE constraint failed: bookings_booking.date,
+            # bookings_booking.time"), so match both forms
+            msg = str(exc)
+            if ('uniq_active_booking_slot' in msg
+                    or ('bookings_booking.date' in msg
+                        and 'bookings_booking.time' in msg)):
+                raise ValidationError(
+                    f"A booking already exists for {self.date} at {self.time}. "
+                    f"Please choose a different time slot."
+                )
+            raise
     
     def __str__(self):
         return f"{self.patient_name} - {self.date} {self.time} ({self.status})"
-    
-    def get_status_badge_class(self):
-        """Return CSS class for status badge"""
+
+    @property
+    def scheduled_at(self):
+        """
+        The slot as a single datetime. The row keeps separate date/time
+        columns — every filter, the slot-uniqueness constraint and the
+        composite ordering indexes are keyed on them — but callers that
+        want one sortable value can use this.
+        """
+        from datetime import datetime
+        return datetime.combine(self.date, self.time)
+
+    @property
+    def service_cached(self):
+        """Service row via the process-local cache (avoids a query when select_related was skipped)"""
+        if 'service' in self._state.fields_cache:
+            return self.service
+        return Service.cached(self.service_id)
+
+    @cached_property
+    def status_badge_class(self):
+        """CSS class for status badge (memoized for the instance lifetime)"""
         status_classes = {
             'Pending': 'status-pending',
             'Confirmed': 'status-confirmed',
@@ -198,3 +273,7 @@ class Booking(models.Model):
             'Cancelled': 'status-cancelled',
         }
         return status_classes.get(self.status, 'status-pending')
+
+    def get_status_badge_class(self):
+        """Return CSS class for status badge (compatibility wrapper)"""
+        return self.status_badge_class
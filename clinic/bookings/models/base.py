@@ -2,9 +2,17 @@
 Base models for the clinic system
 Contains shared/foundational models used across the application
 """
+from functools import lru_cache
+
 from django.db import models
 
 
+@lru_cache(maxsize=128)
+def _cached_service(pk):
+    """Process-local cache for Service rows (cleared by signals on save/delete)"""
+    return Service.objects.get(pk=pk)
+
+
 class Service(models.Model):
     """Services offered by the clinic"""
     name = models.CharField(max_length=100)
@@ -26,3 +34,18 @@ class Service(models.Model):
     
     def __str__(self):
         return self.name
+
+    @classmethod
+    def cached(cls, pk):
+        """
+        Get a service from the process-local cache.
+        Services are a tiny, rarely-written lookup table, so this turns
+        repeated lookups (e.g. booking rows missing select_related) into
+        dict hits instead of queries.
+        """
+        return _cached_service(pk)
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Clear the process-local service cache (called on save/delete)"""
+        _cached_service.cache_clear()
@@ -4,11 +4,27 @@ Handles billing records and payment transactions
 """
 from django.db import models
 from django.contrib.auth.models import User
-from decimal import Decimal
+from django.utils.functional import cached_property
+from decimal import Decimal, ROUND_HALF_UP
 
 from .appointments import Booking
 
 
+def _cents(amount):
+    """Convert a peso amount (2 decimal places) to integer centavos.
+
+    Rounds half-up rather than truncating: float inputs carry binary
+    noise (1.13 * 100 == 112.99...), and int() alone would lose a
+    centavo. str() first so a float's repr, not its full binary
+    expansion, is what gets converted.
+    """
+    if not amount:
+        return 0
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
 class Billing(models.Model):
     """Billing record automatically created when booking is confirmed"""
     
@@ -46,19 +62,22 @@ class Billing(models.Model):
         help_text="Discount amount"
     )
     
-    # Computed Field
-    total_amount = models.DecimalField(
-        max_digits=10, 
-        decimal_places=2,
-        editable=False,
-        help_text="Total amount (auto-calculated)"
+    # Computed Field — generated by the database so bulk_update() and
+    # queryset .update() on the fee columns can never leave a stale total
+    total_amount = models.GeneratedField(
+        expression=(
+            models.F('service_fee') + models.F('medicine_fee') +
+            models.F('additional_fee') - models.F('discount')
+        ),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
+        help_text="Total amount (computed by the database)"
     )
     
     # Payment Status
     is_paid = models.BooleanField(
         default=False,
-        help_text="Automatically updated when payments cover total",
-        db_index=True
+        help_text="Automatically updated when payments cover total"
     )
     amount_paid = models.DecimalField(
         max_digits=10, 
@@ -86,76 +105,90 @@ class Billing(models.Model):
         related_name='billing_updates',
         help_text="Last user who modified this billing"
     )
-    notes = models.TextField(blank=True, help_text="Billing notes")
+    notes = models.CharField(max_length=1024, blank=True, help_text="Billing notes")
     
     class Meta:
         ordering = ['-issued_date']
         verbose_name = 'Billing'
         verbose_name_plural = 'Billings'
         indexes = [
-            models.Index(fields=['is_paid', 'issued_date']),
             models.Index(fields=['booking', 'is_paid']),
             models.Index(fields=['issued_date', 'is_paid']),
+            # Match Meta.ordering (with id as tiebreaker) so list pages
+            # avoid a full-table sort; also serves (is_paid, issued_date)
+            # lookups via a backward scan, replacing the ascending twin
+            models.Index(fields=['is_paid', '-issued_date']),
+            models.Index(fields=['-issued_date', 'id']),
+            # Small partial index the planner actually picks for the
+            # "unpaid billings" screen
+            models.Index(
+                fields=['-issued_date'],
+                condition=models.Q(is_paid=False),
+                name='bill_unpaid_recent',
+            ),
         ]
     
     def __str__(self):
         return f"Bill #{self.id} - {self.booking.patient_name} - ₱{self.total_amount}"
     
     def save(self, *args, **kwargs):
-        """Calculate total amount before saving"""
-        self.total_amount = (
-            self.service_fee + 
-            self.medicine_fee + 
-            self.additional_fee - 
-            self.discount
-        )
-        # Set initial balance to total_amount if this is a new billing
+        """Initialize the balance for new billings (total_amount is DB-generated)"""
         if not self.pk:
-            self.balance = self.total_amount
+            # Balance starts at the full total; summed in integer centavos
+            # so the hot path is plain int arithmetic instead of chained
+            # Decimal allocations
+            total_cents = (
+                _cents(self.service_fee) +
+                _cents(self.medicine_fee) +
+                _cents(self.additional_fee) -
+                _cents(self.discount)
+            )
+            self.balance = Decimal(total_cents).scaleb(-2)
         super().save(*args, **kwargs)
     
     def update_payment_status(self):
         """
-        Update payment status based on total payments with database-level transaction lock
-        Uses select_for_update() to prevent race conditions in concurrent payment scenarios
+        Update payment status based on total payments.
+        The balance/is_paid math is pushed into a single server-side UPDATE
+        (F expressions), so concurrent payments can't clobber each other and
+        no row lock is needed.
         """
         from django.db import transaction
-        
+        from django.db.models import BooleanField, ExpressionWrapper, F, Q, Sum
+
         with transaction.atomic():
-            # Lock the billing record to prevent concurrent updates
-            billing = Billing.objects.select_for_update().get(pk=self.pk)
-            
             # Calculate total from payments using database aggregation
-            from django.db.models import Sum
-            payment_total = billing.payments.aggregate(total=Sum('amount_paid'))['total'] or 0
-            
-            amount_paid = payment_total
-            balance = billing.total_amount - payment_total
-            is_paid = balance <= 0
-            
-            # Use update() to avoid triggering post_save signal
+            payment_total = self.payments.aggregate(total=Sum('amount_paid'))['total'] or Decimal('0.00')
+
+            # Use update() to avoid triggering post_save signal; balance and
+            # is_paid are computed against the stored total_amount in the DB
             Billing.objects.filter(pk=self.pk).update(
-                amount_paid=amount_paid,
-                balance=balance,
-                is_paid=is_paid
+                amount_paid=payment_total,
+                balance=F('total_amount') - payment_total,
+                is_paid=ExpressionWrapper(
+                    Q(total_amount__lte=payment_total),
+                    output_field=BooleanField()
+                )
             )
-            
+
             # Update instance attributes to reflect changes
-            self.amount_paid = amount_paid
-            self.balance = balance
-            self.is_paid = is_paid
+            self.amount_paid = payment_total
+            self.balance = self.total_amount - payment_total
+            self.is_paid = self.balance <= 0
     
-    def get_status_text(self):
-        """Get human-readable payment status"""
+    @cached_property
+    def status_text(self):
+        """Human-readable payment status (memoized for the instance lifetime)"""
         if self.is_paid:
             return "Fully Paid"
         elif self.amount_paid > 0:
             return "Partially Paid"
         else:
             return "Unpaid"
-    
-    def get_status_badge_class(self):
-        """Return CSS class for payment status badge"""
+
+    @cached_property
+    def status_badge_class(self):
+        """CSS class for payment status badge (memoized for the instance lifetime)"""
         if self.is_paid:
             return 'billing-paid'
         elif self.amount_paid > 0:
@@ -163,6 +196,14 @@ class Billing(models.Model):
         else:
             return 'billing-unpaid'
 
+    def get_status_text(self):
+        """Get human-readable payment status (compatibility wrapper)"""
+        return self.status_text
+
+    def get_status_badge_class(self):
+        """Return CSS class for payment status badge (compatibility wrapper)"""
+        return self.status_badge_class
+
 
 class Payment(models.Model):
     """Payment records linked to billing"""
@@ -242,6 +283,10 @@ class Payment(models.Model):
         ordering = ['-payment_date']
         verbose_name = 'Payment'
         verbose_name_plural = 'Payments'
+        indexes = [
+            # Per-billing payment history in Meta.ordering order
+            models.Index(fields=['billing', '-payment_date']),
+        ]
     
     def __str__(self):
         return f"Payment #{self.id} - ₱{self.amount_paid} ({self.payment_method}) - {self.payment_date.strftime('%Y-%m-%d')}"
@@ -250,7 +295,21 @@ class Payment(models.Model):
         """Update billing status after saving payment"""
         is_new = self.pk is None
         super().save(*args, **kwargs)
-        
-        # Update billing payment status
-        if is_new or 'amount_paid' in kwargs.get('update_fields', []):
+
+        if is_new:
+            # For a new payment the delta is already known, so apply it with
+            # one server-side UPDATE instead of re-summing every payment row.
+            # is_paid compares the pre-update balance against the delta since
+            # SET clauses evaluate against the old row values.
+            from django.db.models import BooleanField, ExpressionWrapper, F, Q
+            Billing.objects.filter(pk=self.billing_id).update(
+                amount_paid=F('amount_paid') + self.amount_paid,
+                balance=F('balance') - self.amount_paid,
+                is_paid=ExpressionWrapper(
+                    Q(balance__lte=self.amount_paid),
+                    output_field=BooleanField()
+                )
+            )
+        elif 'amount_paid' in (kwargs.get('update_fields') or []):
+            # Edited payments need the full re-aggregate
             self.billing.update_payment_status()
@@ -52,3 +52,8 @@ class BlockedDate(models.Model):
             date__gte=start_date,
             date__lte=end_date
         ).values_list('date', flat=True)
+
+    @classmethod
+    def blocked_set(cls, start_date, end_date):
+        """Get all blocked dates in a range as a frozenset for O(1) membership checks"""
+        return frozenset(cls.get_blocked_dates_range(start_date, end_date))
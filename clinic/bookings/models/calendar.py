@@ -17,12 +17,13 @@ class Calendar(models.Model):
         ('special_hours', 'Special Operating Hours'),
     ]
     
+    # No db_index: three distinct values, and the (date, event_type)
+    # composite index in Meta covers the real queries
     event_type = models.CharField(
         max_length=20,
         choices=EVENT_TYPE_CHOICES,
         default='blocked',
-        help_text="Type of calendar event",
-        db_index=True
+        help_text="Type of calendar event"
     )
     date = models.DateField(
         help_text="Date of the calendar event",
@@ -88,6 +89,15 @@ class Calendar(models.Model):
             date__lte=end_date,
             event_type='blocked'
         ).values_list('date', flat=True)
+
+    @classmethod
+    def blocked_set(cls, start_date, end_date):
+        """
+        Get all blocked dates in a range as a frozenset for O(1) membership checks.
+        Calendar rendering should call this once and test `date in blocked`
+        instead of calling is_date_blocked() per cell (one query per date).
+        """
+        return frozenset(cls.get_blocked_dates_range(start_date, end_date))
     
     @classmethod
     def get_special_hours(cls, date):
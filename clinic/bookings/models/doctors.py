@@ -2,9 +2,24 @@
 Doctor model for managing medical staff
 """
 from django.db import models
+from django.db.models import Count, Q
 from django.contrib.auth.models import User
 
 
+class DoctorQuerySet(models.QuerySet):
+    """Custom queryset for Doctor with annotated booking counts"""
+
+    def with_counts(self):
+        """Annotate appointment counts so list views avoid per-doctor COUNT queries"""
+        return self.annotate(
+            _appointment_count=Count('bookings'),
+            _active_appointments_count=Count(
+                'bookings',
+                filter=~Q(bookings__status='Cancelled')
+            ),
+        )
+
+
 class Doctor(models.Model):
     """Medical staff/doctor profiles"""
     
@@ -34,7 +49,8 @@ class Doctor(models.Model):
     )
     
     # Work Schedule (stored as JSON or text)
-    schedule_notes = models.TextField(
+    schedule_notes = models.CharField(
+        max_length=1024,
         blank=True,
         help_text="Working hours and availability notes"
     )
@@ -49,6 +65,8 @@ class Doctor(models.Model):
         related_name='created_doctors'
     )
     
+    objects = DoctorQuerySet.as_manager()
+
     class Meta:
         ordering = ['last_name', 'first_name']
         verbose_name = 'Doctor'
@@ -71,10 +89,16 @@ class Doctor(models.Model):
     
     @property
     def appointment_count(self):
-        """Get total number of appointments"""
+        """Get total number of appointments (uses with_counts() annotation when present)"""
+        annotated = getattr(self, '_appointment_count', None)
+        if annotated is not None:
+            return annotated
         return self.bookings.count()
-    
+
     @property
     def active_appointments_count(self):
-        """Get number of active (non-cancelled) appointments"""
+        """Get number of active (non-cancelled) appointments (uses with_counts() annotation when present)"""
+        annotated = getattr(self, '_active_appointments_count', None)
+        if annotated is not None:
+            return annotated
         return self.bookings.exclude(status='Cancelled').count()
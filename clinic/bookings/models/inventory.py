@@ -39,7 +39,13 @@ class Inventory(models.Model):
         indexes = [
             models.Index(fields=['category', 'status']),
             models.Index(fields=['status', 'quantity']),
-            models.Index(fields=['expiry_date']),  # For expiry alerts
+            # Expiry alerts only ever scan dated medicines, so keep the
+            # index to that slice instead of every row with a NULL date
+            models.Index(
+                fields=['expiry_date'],
+                name='inv_medicine_expiry_idx',
+                condition=models.Q(expiry_date__isnull=False, category='Medicine'),
+            ),
         ]
     
     def __str__(self):
@@ -55,6 +61,47 @@ class Inventory(models.Model):
             self.status = 'In Stock'
         super().save(*args, **kwargs)
 
+    @classmethod
+    def refresh_status(cls, *pks):
+        """
+        Recompute the status column in the database for callers that
+        adjust quantity with queryset update() and therefore bypass save().
+        Mirrors the thresholds in save(); handles any number of rows in
+        one UPDATE.
+        """
+        from django.db.models import Case, F, Value, When
+
+        cls.objects.filter(pk__in=pks).update(
+            status=Case(
+                When(quantity__lte=0, then=Value('Out of Stock')),
+                When(quantity__lte=F('stock'), then=Value('Low Stock')),
+                default=Value('In Stock'),
+            )
+        )
+
+
+class LowStockView(models.Model):
+    """
+    Read-only mapping of the inventory_lowstock SQL view (created in
+    migration 0039). Dashboards count/list low-stock alerts against this
+    narrow view instead of scanning the full Inventory table.
+    """
+
+    item_id = models.IntegerField(primary_key=True)
+    name = models.CharField(max_length=255)
+    category = models.CharField(max_length=20)
+    quantity = models.IntegerField()
+    stock = models.IntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'inventory_lowstock'
+        verbose_name = 'Low Stock Item'
+        verbose_name_plural = 'Low Stock Items'
+
+    def __str__(self):
+        return f"{self.name} ({self.category}) - Qty: {self.quantity}/{self.stock}"
+
 
 class StockTransaction(models.Model):
     """Track all stock in/out transactions for inventory items"""
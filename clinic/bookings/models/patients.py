@@ -2,13 +2,17 @@
 Patient and medical record models
 Handles patient information, medical records, and medical images
 """
+import re
+
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import RegexValidator
 
-# Phone number validator
+# Phone number validator; the pattern is compiled once at import so every
+# clean() call reuses the same Pattern object
+_PHONE_RE = re.compile(r'^\+?1?\d{9,15}$')
 phone_validator = RegexValidator(
-    regex=r'^\+?1?\d{9,15}$',
+    regex=_PHONE_RE,
     message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed."
 )
 
@@ -90,7 +94,15 @@ class Patient(models.Model):
 class MedicalRecord(models.Model):
     """Individual medical record entries for patients"""
     patient = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name='medical_records')
-    
+    booking = models.ForeignKey(
+        'Booking',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='medical_records',
+        help_text="Booking this record was created from (direct link for billing lookups)"
+    )
+
     # Visit Information
     visit_date = models.DateTimeField(db_index=True)
     chief_complaint = models.TextField(help_text="Patient's main concern or reason for visit")
@@ -129,8 +141,17 @@ class MedicalRecord(models.Model):
 
 
 def medical_image_upload_path(instance, filename):
-    """Generate upload path for medical images"""
-    return f'medical_records/{instance.medical_record.patient.user.username}/{instance.medical_record.visit_date.strftime("%Y-%m-%d")}/{filename}'
+    """
+    Generate a hash-sharded upload path for medical images.
+
+    Uses only the already-loaded medical_record_id (the old
+    username/visit-date scheme cost two FK fetches per upload) and
+    spreads files across 256x256 buckets so no directory grows hot.
+    Existing rows keep the paths stored in their image column.
+    """
+    import hashlib
+    h = hashlib.sha1(f"{instance.medical_record_id}-{filename}".encode()).hexdigest()
+    return f'medical_records/{h[:2]}/{h[2:4]}/{h}-{filename}'
 
 
 class MedicalImage(models.Model):
@@ -2,13 +2,21 @@
 Point of Sale (POS) models
 Handles POS sales transactions and sale items
 """
+import logging
+
 from django.db import models
 from django.contrib.auth.models import User
 from decimal import Decimal
 
+from .billing import _cents
 from .patients import Patient
 from .inventory import Inventory, StockTransaction
 
+# How many StockTransaction rows to insert per bulk_create batch
+STOCK_TXN_BATCH = 100
+
+logger = logging.getLogger(__name__)
+
 
 class POSSale(models.Model):
     """Main POS Sales transaction"""
@@ -35,10 +43,11 @@ class POSSale(models.Model):
     
     # Transaction Info
     receipt_number = models.CharField(
-        max_length=50, 
-        unique=True, 
+        max_length=50,
+        unique=True,
         editable=False,
-        help_text="Auto-generated receipt number"
+        null=True,
+        help_text="Auto-generated receipt number (derived from the primary key)"
     )
     sale_date = models.DateTimeField(auto_now_add=True)
     
@@ -163,38 +172,219 @@ class POSSale(models.Model):
     def __str__(self):
         return f"Receipt #{self.receipt_number} - {self.customer_name} - ₱{self.total_amount}"
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._snapshot_pricing()
+
+    def _snapshot_pricing(self):
+        """Remember the pricing inputs so save() can tell when they changed"""
+        self._loaded_pricing = (
+            self.subtotal,
+            self.discount_percent,
+            self.tax_percent,
+            self.amount_received,
+        )
+
     def save(self, *args, **kwargs):
-        """Generate receipt number and calculate totals"""
-        # Generate receipt number if new
-        if not self.receipt_number:
-            from django.utils import timezone
-            timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
-            self.receipt_number = f"REC-{timestamp}"
-        
-        # Calculate discount
-        self.discount_amount = (self.subtotal * self.discount_percent) / 100
-        
-        # Calculate subtotal after discount
-        amount_after_discount = self.subtotal - self.discount_amount
-        
-        # Calculate tax
-        self.tax_amount = (amount_after_discount * self.tax_percent) / 100
-        
-        # Calculate total
-        self.total_amount = amount_after_discount + self.tax_amount
-        
-        # Calculate change
-        self.change_amount = max(0, self.amount_received - self.total_amount)
-        
+        """Generate receipt number and recalculate totals when inputs changed"""
+        needs_receipt = not self.receipt_number
+
+        # Recompute the derived amounts only when a pricing input actually
+        # changed since load; status/notes edits skip the arithmetic and,
+        # with update_fields, become narrow UPDATEs
+        pricing = (
+            self.subtotal,
+            self.discount_percent,
+            self.tax_percent,
+            self.amount_received,
+        )
+        if self.pk is None or pricing != self._loaded_pricing:
+            # Summed in integer centavos (percentages as basis points) so
+            # the hot path is plain int arithmetic instead of chained
+            # Decimal allocations; converted back once at the end
+            subtotal_c = _cents(self.subtotal)
+            discount_bp = int((self.discount_percent or 0) * 100)
+            tax_bp = int((self.tax_percent or 0) * 100)
+
+            discount_c = subtotal_c * discount_bp // 10000
+            after_discount_c = subtotal_c - discount_c
+            tax_c = after_discount_c * tax_bp // 10000
+            total_c = after_discount_c + tax_c
+            change_c = max(0, _cents(self.amount_received) - total_c)
+
+            self.discount_amount = Decimal(discount_c).scaleb(-2)
+            self.tax_amount = Decimal(tax_c).scaleb(-2)
+            self.total_amount = Decimal(total_c).scaleb(-2)
+            self.change_amount = Decimal(change_c).scaleb(-2)
+
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = list(update_fields) + [
+                    'discount_amount', 'tax_amount', 'total_amount', 'change_amount',
+                ]
+
         super().save(*args, **kwargs)
+
+        # Number the receipt off the DB-assigned primary key (a native
+        # sequence), which cannot collide under concurrent checkouts the
+        # way the old second-resolution timestamp could. The row is
+        # inserted with NULL first — unique columns allow multiple NULLs
+        # on both SQLite and Postgres — then patched in one UPDATE.
+        if needs_receipt:
+            self.receipt_number = f"REC-{self.pk:010d}"
+            POSSale.objects.filter(pk=self.pk).update(
+                receipt_number=self.receipt_number
+            )
+
+        self._snapshot_pricing()
     
     def calculate_subtotal(self):
-        """Calculate subtotal from all sale items"""
-        subtotal = sum(item.line_total for item in self.items.all())
+        """
+        Recalculate totals from sale items.
+
+        The subtotal is summed by the database instead of loading every
+        item row into Python, and the result is written with a single
+        queryset update() so this never re-enters POSSale.save().
+        """
+        from django.db.models import Sum
+
+        subtotal = self.items.aggregate(s=Sum('line_total'))['s'] or Decimal('0.00')
+
+        # Same integer-centavo arithmetic as save()
+        subtotal_c = _cents(subtotal)
+        discount_bp = int((self.discount_percent or 0) * 100)
+        tax_bp = int((self.tax_percent or 0) * 100)
+
+        discount_c = subtotal_c * discount_bp // 10000
+        after_discount_c = subtotal_c - discount_c
+        tax_c = after_discount_c * tax_bp // 10000
+        total_c = after_discount_c + tax_c
+        change_c = max(0, _cents(self.amount_received) - total_c)
+
+        discount_amount = Decimal(discount_c).scaleb(-2)
+        tax_amount = Decimal(tax_c).scaleb(-2)
+        total_amount = Decimal(total_c).scaleb(-2)
+        change_amount = Decimal(change_c).scaleb(-2)
+
+        POSSale.objects.filter(pk=self.pk).update(
+            subtotal=subtotal,
+            discount_amount=discount_amount,
+            tax_amount=tax_amount,
+            total_amount=total_amount,
+            change_amount=change_amount,
+        )
+
+        # Keep the in-memory instance consistent with the row just written
         self.subtotal = subtotal
-        self.save()
+        self.discount_amount = discount_amount
+        self.tax_amount = tax_amount
+        self.total_amount = total_amount
+        self.change_amount = change_amount
         return subtotal
     
+    def summarize(self):
+        """
+        Subtotal, line count and distinct category count for this sale in
+        a single aggregate query — for views that would otherwise loop
+        over prefetched items three times.
+        """
+        from django.db.models import Count, Sum
+
+        return self.items.aggregate(
+            subtotal=Sum('line_total'),
+            item_count=Count('id'),
+            category_count=Count('inventory_item__category', distinct=True),
+        )
+
+    def apply_inventory_deductions(self, performed_by=None):
+        """
+        Deduct stock for every line item of this sale at once.
+
+        All deltas are applied with a single CASE UPDATE on Inventory
+        (lines without sufficient stock are skipped, matching the old
+        per-item behavior), statuses are refreshed in one more UPDATE,
+        and the stock transactions are bulk-inserted. Replaces the
+        per-item fetch/save/insert loop at sale completion.
+        """
+        from django.db import connection
+
+        # Collapse duplicate lines into one delta per inventory item
+        deltas = {}
+        for item_id, qty in self.items.values_list('inventory_item_id', 'quantity'):
+            deltas[item_id] = deltas.get(item_id, 0) + qty
+        if not deltas:
+            return []
+
+        on_hand = dict(
+            Inventory.objects.filter(pk__in=deltas).values_list('item_id', 'quantity')
+        )
+        deductible = {
+            item_id: qty for item_id, qty in deltas.items()
+            if on_hand.get(item_id, 0) >= qty
+        }
+        if not deductible:
+            return []
+
+        # The per-item quantity guard in the WHERE clause makes the
+        # deduction race-safe (same filter(quantity__gte=qty) contract
+        # as Inventory.deduct_from_inventory, batched); RETURNING tells
+        # us which rows actually took the deduction
+        when_sql = ' '.join(['WHEN %s THEN quantity - %s'] * len(deductible))
+        guard_sql = ' '.join(['WHEN %s THEN %s'] * len(deductible))
+        placeholders = ', '.join(['%s'] * len(deductible))
+        params = []
+        for item_id, qty in deductible.items():
+            params.extend([item_id, qty])
+        params.extend(deductible)
+        for item_id, qty in deductible.items():
+            params.extend([item_id, qty])
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE bookings_inventory "
+                f"SET quantity = CASE item_id {when_sql} END "
+                f"WHERE item_id IN ({placeholders}) "
+                f"AND quantity >= CASE item_id {guard_sql} END "
+                f"RETURNING item_id",
+                params,
+            )
+            applied = {row[0] for row in cursor.fetchall()}
+
+        skipped = set(deductible) - applied
+        if skipped:
+            # A concurrent sale won the stock between our read and the
+            # guarded UPDATE; those lines stay undeducted, as they would
+            # have been skipped outright had the read seen the new level
+            logger.warning(
+                "POS sale %s: insufficient stock for items %s at deduction time",
+                self.pk, sorted(skipped)
+            )
+        if not applied:
+            return []
+
+        Inventory.refresh_status(*applied)
+
+        txns = [
+            StockTransaction(
+                inventory_item_id=item_id,
+                transaction_type='Stock Out',
+                quantity=qty,
+                performed_by=performed_by or self.created_by,
+                notes=f"POS Sale - Receipt #{self.receipt_number}"
+            )
+            for item_id, qty in deductible.items()
+            if item_id in applied
+        ]
+        # Only the audit trail may fail quietly; the deduction above is
+        # already committed and the sale must still complete
+        try:
+            StockTransaction.objects.bulk_create(txns, batch_size=STOCK_TXN_BATCH)
+        except Exception:
+            logger.exception(
+                "POS sale %s: stock deducted but audit insert failed", self.pk
+            )
+        return txns
+
     def get_status_badge_class(self):
         """Return CSS class for status badge"""
         status_classes = {
@@ -244,32 +434,48 @@ class POSSaleItem(models.Model):
         ordering = ['id']
         verbose_name = 'Sale Item'
         verbose_name_plural = 'Sale Items'
+        indexes = [
+            # Cart reads filter by sale and order by id
+            models.Index(fields=['sale', 'id']),
+        ]
     
     def __str__(self):
         return f"{self.inventory_item.name} x{self.quantity} - ₱{self.line_total}"
     
-    def save(self, *args, **kwargs):
-        """Calculate line total and update inventory"""
-        # Set unit price from current inventory price if not set
+    def save(self, *args, _skip_subtotal=False, **kwargs):
+        """
+        Calculate line total and update inventory.
+
+        Callers saving many items in one transaction can pass
+        _skip_subtotal=True and run sale.calculate_subtotal() once at the
+        end instead of recomputing totals per item.
+        """
+        # Set unit price from current inventory price if not set; fetch
+        # just the price column unless the related row is already cached
         if not self.unit_price:
-            self.unit_price = self.inventory_item.price
-        
+            if 'inventory_item' in self._state.fields_cache:
+                self.unit_price = self.inventory_item.price
+            else:
+                self.unit_price = Inventory.objects.values_list(
+                    'price', flat=True
+                ).get(pk=self.inventory_item_id)
+
         # Calculate line total
         self.line_total = self.unit_price * self.quantity
-        
+
         # Check if this is a new item
         is_new = self.pk is None
         old_quantity = 0
-        
+
         if not is_new:
-            # Get the old quantity before update
-            old_item = POSSaleItem.objects.get(pk=self.pk)
-            old_quantity = old_item.quantity
-        
+            # Get the old quantity before update (single column, not the full row)
+            old_quantity = POSSaleItem.objects.only('quantity').get(pk=self.pk).quantity
+
         super().save(*args, **kwargs)
-        
+
         # Update sale subtotal
-        self.sale.calculate_subtotal()
+        if not _skip_subtotal:
+            self.sale.calculate_subtotal()
         
         # Update inventory only if sale is completed
         if self.sale.status == 'Completed':
@@ -284,34 +490,68 @@ class POSSaleItem(models.Model):
                 else:
                     self.return_to_inventory(abs(quantity_diff))
     
-    def deduct_from_inventory(self, qty):
-        """Deduct quantity from inventory"""
-        if self.inventory_item.quantity >= qty:
-            self.inventory_item.quantity -= qty
-            self.inventory_item.save()
-            
-            # Create stock transaction
-            StockTransaction.objects.create(
-                inventory_item=self.inventory_item,
-                transaction_type='Stock Out',
-                quantity=qty,
-                performed_by=self.sale.created_by,
-                notes=f"POS Sale - Receipt #{self.sale.receipt_number}"
+    def deduct_from_inventory(self, qty, txns=None):
+        """
+        Deduct quantity from inventory.
+
+        When txns is a list the stock transaction is appended to it for a
+        later bulk_create instead of issuing one INSERT per item.
+
+        The deduction is a single conditional UPDATE (quantity >= qty in
+        the WHERE clause), so concurrent sales cannot oversell; raises
+        ValidationError when stock is insufficient.
+        """
+        from django.core.exceptions import ValidationError
+        from django.db.models import F
+
+        updated = Inventory.objects.filter(
+            pk=self.inventory_item_id,
+            quantity__gte=qty
+        ).update(quantity=F('quantity') - qty)
+
+        if not updated:
+            item_name = Inventory.objects.values_list(
+                'name', flat=True
+            ).get(pk=self.inventory_item_id)
+            raise ValidationError(
+                f"Insufficient stock for {item_name}. "
+                f"Required: {qty}"
             )
-    
-    def return_to_inventory(self, qty):
+
+        Inventory.refresh_status(self.inventory_item_id)
+
+        txn = StockTransaction(
+            inventory_item_id=self.inventory_item_id,
+            transaction_type='Stock Out',
+            quantity=qty,
+            performed_by=self.sale.created_by,
+            notes=f"POS Sale - Receipt #{self.sale.receipt_number}"
+        )
+        if txns is not None:
+            txns.append(txn)
+        else:
+            txn.save()
+
+    def return_to_inventory(self, qty, txns=None):
         """Return quantity to inventory (for refunds/cancellations)"""
-        self.inventory_item.quantity += qty
-        self.inventory_item.save()
-        
-        # Create stock transaction
-        StockTransaction.objects.create(
-            inventory_item=self.inventory_item,
+        from django.db.models import F
+
+        Inventory.objects.filter(pk=self.inventory_item_id).update(
+            quantity=F('quantity') + qty
+        )
+        Inventory.refresh_status(self.inventory_item_id)
+
+        txn = StockTransaction(
+            inventory_item_id=self.inventory_item_id,
             transaction_type='Stock In',
             quantity=qty,
             performed_by=self.sale.created_by,
             notes=f"POS Return - Receipt #{self.sale.receipt_number}"
         )
+        if txns is not None:
+            txns.append(txn)
+        else:
+            txn.save()
     
     def delete(self, *args, **kwargs):
         """Return items to inventory when deleted"""
@@ -2,8 +2,11 @@
 Prescription models
 Handles medicines prescribed to patients
 """
+from decimal import Decimal
+
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models import Sum
 
 from .patients import MedicalRecord
 from .inventory import Inventory, StockTransaction
@@ -32,6 +35,14 @@ class Prescription(models.Model):
         blank=True,
         help_text="Medicine name if not in inventory"
     )
+    # Denormalized copy of the medicine name so lists and __str__ render
+    # without joining Inventory; refreshed on every save()
+    medicine_name_cached = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text="Cached medicine name for display without a join"
+    )
     quantity = models.IntegerField(default=1, help_text="Quantity prescribed")
     dosage = models.CharField(max_length=100, help_text="e.g., '1 tablet twice daily'")
     duration = models.CharField(max_length=100, blank=True, help_text="e.g., '7 days', '2 weeks'")
@@ -87,9 +98,29 @@ class Prescription(models.Model):
         ordering = ['-prescribed_date']
         verbose_name = 'Prescription'
         verbose_name_plural = 'Prescriptions'
+        indexes = [
+            # Patient-history reads: filter by medical_record, newest first
+            models.Index(fields=['medical_record', '-prescribed_date']),
+        ]
     
+    @classmethod
+    def total_for_record(cls, medical_record_id, exclude_pk=None):
+        """
+        Total prescription cost for a medical record, summed in the
+        database. exclude_pk lets delete-side callers leave out a row
+        that is going away regardless of transaction visibility.
+        """
+        qs = cls.objects.filter(medical_record_id=medical_record_id)
+        if exclude_pk is not None:
+            qs = qs.exclude(pk=exclude_pk)
+        return qs.aggregate(total=Sum('total_price'))['total'] or Decimal('0.00')
+
     def __str__(self):
-        medicine_name = self.custom_medicine_name if self.custom_medicine_name else self.medicine.name
+        medicine_name = (
+            self.medicine_name_cached
+            or self.custom_medicine_name
+            or self.medicine.name
+        )
         return f"{medicine_name} x{self.quantity} - {self.medical_record.patient.user.get_full_name()}"
     
     def save(self, *args, **kwargs):
@@ -104,6 +135,11 @@ class Prescription(models.Model):
         # If custom medicine and no price set, default to 0
         if not self.medicine and not self.unit_price:
             self.unit_price = 0
+
+        # Refresh the denormalized display name
+        self.medicine_name_cached = self.custom_medicine_name or (
+            self.medicine.name if self.medicine_id else ''
+        )
         
         # Calculate total
         self.total_price = self.unit_price * self.quantity
@@ -115,8 +151,12 @@ class Prescription(models.Model):
         with transaction.atomic():
             # If new prescription with inventory medicine, check stock availability first
             if is_new and self.medicine:
-                # Lock the inventory item to prevent race conditions
-                medicine = Inventory.objects.select_for_update().get(pk=self.medicine.pk)
+                # Lock only the inventory row (of=('self',) keeps joined
+                # tables unlocked on Postgres; ignored on SQLite) and load
+                # just the columns the stock math and status recompute need
+                medicine = Inventory.objects.select_for_update(of=('self',)).only(
+                    'item_id', 'quantity', 'stock', 'status', 'name'
+                ).get(pk=self.medicine_id)
                 
                 # Validate sufficient stock before saving
                 if medicine.quantity < self.quantity:
@@ -128,9 +168,10 @@ class Prescription(models.Model):
                 # Save prescription first
                 super().save(*args, **kwargs)
                 
-                # Deduct from inventory
+                # Deduct from inventory; narrow UPDATE keeps the locked
+                # window short
                 medicine.quantity -= self.quantity
-                medicine.save()
+                medicine.save(update_fields=['quantity', 'status'])
                 
                 # Create stock transaction
                 StockTransaction.objects.create(
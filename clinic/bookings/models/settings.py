@@ -2,8 +2,28 @@
 Clinic Settings Model
 Stores global clinic configuration
 """
+from django.core.cache import cache
 from django.db import models
 
+# Cache key for the settings singleton
+CLINIC_SETTINGS_CACHE_KEY = 'clinic_settings'
+
+
+class ClinicSettingsManager(models.Manager):
+    """Manager that serves the settings singleton from cache"""
+
+    def load(self):
+        """
+        Return the singleton, hitting the database only on cache miss.
+        The short TTL bounds staleness across worker processes; save()
+        invalidates eagerly for the writing process.
+        """
+        obj = cache.get(CLINIC_SETTINGS_CACHE_KEY)
+        if obj is None:
+            obj, _created = self.get_or_create(pk=1)
+            cache.set(CLINIC_SETTINGS_CACHE_KEY, obj, 60)
+        return obj
+
 
 class ClinicSettings(models.Model):
     """Singleton model for clinic-wide settings"""
@@ -46,7 +66,9 @@ class ClinicSettings(models.Model):
     
     # System Fields
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = ClinicSettingsManager()
+
     class Meta:
         verbose_name = "Clinic Settings"
         verbose_name_plural = "Clinic Settings"
@@ -54,30 +76,47 @@ class ClinicSettings(models.Model):
     def __str__(self):
         return f"Clinic Settings (Updated: {self.updated_at.strftime('%Y-%m-%d %H:%M')})"
     
+    # Memoized slot lists keyed on the hours/duration that produced them;
+    # shared across instances since the model is a singleton
+    _slots_cache = {}
+
     def save(self, *args, **kwargs):
         """Ensure only one instance exists (singleton pattern)"""
         self.pk = 1
         super().save(*args, **kwargs)
-    
+        cache.delete(CLINIC_SETTINGS_CACHE_KEY)
+        type(self)._slots_cache.clear()
+
     @classmethod
     def load(cls):
-        """Load or create the singleton settings instance"""
-        obj, created = cls.objects.get_or_create(pk=1)
-        return obj
+        """Load or create the singleton settings instance (cache-backed)"""
+        return cls.objects.load()
     
     def get_time_slots(self):
-        """Generate list of time slots based on operating hours"""
-        from datetime import datetime, timedelta
-        
+        """
+        Generate list of time slots based on operating hours.
+
+        The list only depends on the opening/closing times and slot
+        duration, so it is memoized per combination; save() clears the
+        memo when hours change.
+        """
+        key = (self.opening_time, self.closing_time, self.appointment_slot_duration)
+        cached = self._slots_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Plain integer minutes-since-midnight; no datetime/timedelta
+        # objects or strftime calls per slot
+        start = self.opening_time.hour * 60 + self.opening_time.minute
+        end = self.closing_time.hour * 60 + self.closing_time.minute
+
         slots = []
-        current = datetime.combine(datetime.today(), self.opening_time)
-        end = datetime.combine(datetime.today(), self.closing_time)
-        
-        while current < end:
+        for minutes in range(start, end, self.appointment_slot_duration):
+            h, mm = divmod(minutes, 60)
             slots.append({
-                'time': current.strftime('%H:%M'),
-                'display': current.strftime('%I:%M %p')
+                'time': f"{h:02d}:{mm:02d}",
+                'display': f"{((h - 1) % 12) + 1:02d}:{mm:02d} {'AM' if h < 12 else 'PM'}"
             })
-            current += timedelta(minutes=self.appointment_slot_duration)
-        
+
+        self._slots_cache[key] = slots
         return slots
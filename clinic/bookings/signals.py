@@ -5,60 +5,105 @@ from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.utils import timezone
-from django.db import transaction
-from .models import Booking, Billing, Payment, Patient, MedicalRecord, Prescription
+from django.db import IntegrityError, transaction
+from decimal import Decimal
+from .models import Booking, Billing, Payment, Patient, MedicalRecord, Prescription, Service
+from .models.billing import _cents
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-@receiver(pre_save, sender=Booking)
+def _booking_with_billing(medical_record):
+    """
+    Resolve the booking (with its billing joined) for a medical record.
+
+    Records created since the booking FK was added carry a direct link -
+    one indexed SELECT. Older rows fall back to the legacy scan for the
+    patient's most recent active booking by email.
+    """
+    if medical_record.booking_id:
+        return Booking.objects.select_related('billing').filter(
+            pk=medical_record.booking_id
+        ).first()
+    return Booking.objects.filter(
+        patient_email=medical_record.patient.user.email,
+        status__in=['Confirmed', 'Completed']
+    ).select_related('billing').order_by('-date', '-time').first()
+
+
+@receiver(post_save, sender=Service, dispatch_uid='bookings.invalidate_service_cache.save')
+@receiver(post_delete, sender=Service, dispatch_uid='bookings.invalidate_service_cache.delete')
+def invalidate_service_cache(sender, instance, **kwargs):
+    """Clear the process-local Service cache whenever a service changes"""
+    Service.invalidate_cache()
+
+
+@receiver(pre_save, sender=Booking, dispatch_uid='bookings.check_booking_confirmation')
 def check_booking_confirmation(sender, instance, **kwargs):
     """
     Check if booking status is changing to Confirmed or consultation_status is changing to Done
     Store previous state in database to avoid race conditions
     """
-    if instance.pk:
-        try:
-            old_instance = Booking.objects.select_for_update().get(pk=instance.pk)
-            
-            # Store flags in a thread-safe way by checking actual database state
-            # Check if consultation_status changed to 'Done'
-            if old_instance.consultation_status != 'Done' and instance.consultation_status == 'Done':
-                # Mark for consultation completion handling
-                instance._consultation_just_completed = True
-                logger.info(f"Booking {instance.id} consultation marked as Done - will create records")
-            
-            # Check if status changed from non-Confirmed to Confirmed
-            elif old_instance.status != 'Confirmed' and instance.status == 'Confirmed':
-                # Mark for appointment creation
-                instance._booking_just_confirmed = True
-                logger.info(f"Booking {instance.id} confirmed - will create Appointment record")
-                
-        except Booking.DoesNotExist:
-            pass
+    if not instance.pk:
+        return
+
+    # When the caller names the fields being written and neither status
+    # column is among them, no transition is possible - skip the lookup
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not ({'status', 'consultation_status'} & set(update_fields)):
+        return
+
+    # Fetch just the two compared columns instead of hydrating (and
+    # row-locking) the full old row
+    old = Booking.objects.filter(pk=instance.pk).values(
+        'status', 'consultation_status'
+    ).first()
+    if old is None:
+        return
+
+    # Check if consultation_status changed to 'Done'
+    if old['consultation_status'] != 'Done' and instance.consultation_status == 'Done':
+        # Mark for consultation completion handling
+        instance._consultation_just_completed = True
+        logger.info("Booking %s consultation marked as Done - will create records", instance.id)
+
+    # Check if status changed from non-Confirmed to Confirmed
+    elif old['status'] != 'Confirmed' and instance.status == 'Confirmed':
+        # Mark for appointment creation
+        instance._booking_just_confirmed = True
+        logger.info("Booking %s confirmed - will create Appointment record", instance.id)
 
 
-@receiver(post_save, sender=Booking)
+@receiver(post_save, sender=Booking, dispatch_uid='bookings.create_appointment_or_patient_records')
 def create_appointment_or_patient_records(sender, instance, created, **kwargs):
     """
     Handle two scenarios with proper transaction management:
     1. When booking is confirmed: Create Appointment record only
     2. When consultation_status = 'Done': Create Patient, MedicalRecord, and Billing
     """
+    # Saves that name their fields and touch neither status column can't
+    # carry a transition flag - skip the attribute checks outright
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not ({'status', 'consultation_status'} & set(update_fields)):
+        return
+
     # Scenario 1: Booking confirmed - Create Appointment record
     if hasattr(instance, '_booking_just_confirmed') and instance._booking_just_confirmed:
         try:
             with transaction.atomic():
                 from .models import Appointment
                 
-                # Use get_or_create to prevent duplicates
+                # Use get_or_create to prevent duplicates; only the
+                # natural key (email, date, time) goes in the lookup so
+                # the SELECT can use the composite index, the rest rides
+                # in defaults
                 appointment, appointment_created = Appointment.objects.get_or_create(
-                    name=instance.patient_name,
                     email=instance.patient_email,
                     date=instance.date,
                     time=instance.time,
                     defaults={
+                        'name': instance.patient_name,
                         'phone': instance.patient_phone,
                         'message': instance.notes,
                         'status': 'Confirmed',
@@ -67,58 +112,102 @@ def create_appointment_or_patient_records(sender, instance, created, **kwargs):
                 )
                 
                 if appointment_created:
-                    logger.info(f"[OK] Created Appointment #{appointment.id} for confirmed booking #{instance.id}")
+                    logger.info("[OK] Created Appointment #%s for confirmed booking #%s", appointment.id, instance.id)
                 else:
-                    logger.info(f"[INFO] Appointment already exists for booking #{instance.id}")
+                    logger.info("[INFO] Appointment already exists for booking #%s", instance.id)
             
             # Clean up the flag
             delattr(instance, '_booking_just_confirmed')
             
         except Exception as e:
-            logger.error(f"[ERROR] Error creating Appointment for booking {instance.id}: {str(e)}")
+            logger.error("[ERROR] Error creating Appointment for booking %s: %s", instance.id, e)
     
     # Scenario 2: Consultation Done - Create Patient, MedicalRecord, and Billing
     elif hasattr(instance, '_consultation_just_completed') and instance._consultation_just_completed:
         try:
+            # Generate the temporary password before the transaction opens;
+            # secrets reads from the OS entropy pool and there's no reason
+            # to hold the DB transaction (and any row locks) through it
+            import secrets
+            import string
+            alphabet = string.ascii_letters + string.digits + string.punctuation
+            temp_password = ''.join(secrets.choice(alphabet) for i in range(16))
+
+            # Resolve the service once up front. service_id is already on
+            # the instance, and service_cached serves the row from the
+            # process-local Service cache, so this costs no query when the
+            # caller skipped select_related('service')
+            service = instance.service_cached if instance.service_id else None
+
             with transaction.atomic():
                 # 1. Create or get User account for the patient
-                username = instance.patient_email.split('@')[0].lower()
-                base_username = username
+                base_username = instance.patient_email.split('@')[0].lower()
+
+                # Fetch every taken username with this prefix once and
+                # pick the first free suffix in Python, instead of one
+                # existence query per collision
+                taken = set(
+                    User.objects.filter(
+                        username__startswith=base_username
+                    ).values_list('username', flat=True)
+                )
+                username = base_username
                 counter = 1
-                
-                # Ensure unique username with database lock
-                while User.objects.select_for_update().filter(username=username).exists():
+                while username in taken:
                     username = f"{base_username}{counter}"
                     counter += 1
-                
+
                 # Split patient name into first and last name
                 name_parts = instance.patient_name.strip().split(' ', 1)
                 first_name = name_parts[0]
                 last_name = name_parts[1] if len(name_parts) > 1 else ''
-                
-                user, user_created = User.objects.get_or_create(
-                    email=instance.patient_email,
-                    defaults={
-                        'username': username,
-                        'first_name': first_name,
-                        'last_name': last_name,
-                        'is_active': True,
-                        'is_staff': False,
-                    }
-                )
+
+                user_defaults = {
+                    'username': username,
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'is_active': True,
+                    'is_staff': False,
+                }
+                try:
+                    user, user_created = User.objects.get_or_create(
+                        email=instance.patient_email,
+                        defaults=user_defaults,
+                    )
+                except IntegrityError:
+                    # A concurrent save grabbed the username between the
+                    # lookup and the INSERT; recompute the suffix and
+                    # retry once (get_or_create's internal savepoint has
+                    # already rolled the failed INSERT back)
+                    taken = set(
+                        User.objects.filter(
+                            username__startswith=base_username
+                        ).values_list('username', flat=True)
+                    )
+                    while username in taken:
+                        username = f"{base_username}{counter}"
+                        counter += 1
+                    user_defaults['username'] = username
+                    user, user_created = User.objects.get_or_create(
+                        email=instance.patient_email,
+                        defaults=user_defaults,
+                    )
                 
                 if user_created:
-                    # Generate a random secure password instead of hardcoded one
-                    import secrets
-                    import string
-                    alphabet = string.ascii_letters + string.digits + string.punctuation
-                    temp_password = ''.join(secrets.choice(alphabet) for i in range(16))
-                    user.set_password(temp_password)
-                    user.save()
-                    logger.info(f"[OK] Created new user account: {user.username} with temporary password")
-                    # NOTE: Email functionality not configured in this version
-                    # For production deployment, configure EMAIL_BACKEND in settings.py
-                    # and implement password reset email notification here
+                    # PBKDF2 hashing is deliberately slow; defer it until
+                    # after commit so it doesn't extend the transaction
+                    # window. Until then the account has no usable
+                    # password, which is also where a failed hash leaves
+                    # it - safe either way.
+                    def _set_temp_password(user=user, temp_password=temp_password):
+                        user.set_password(temp_password)
+                        user.save(update_fields=['password'])
+                        logger.info("[OK] Created new user account: %s with temporary password", user.username)
+                        # NOTE: Email functionality not configured in this version
+                        # For production deployment, configure EMAIL_BACKEND in settings.py
+                        # and implement password reset email notification here
+
+                    transaction.on_commit(_set_temp_password)
                 
                 # 2. Create Patient profile if it doesn't exist
                 patient, patient_created = Patient.objects.get_or_create(
@@ -131,72 +220,88 @@ def create_appointment_or_patient_records(sender, instance, created, **kwargs):
                     }
                 )
                 
-                if patient_created:
-                    logger.info(f"[OK] Created new patient profile for {user.get_full_name()}")
+                if patient_created and logger.isEnabledFor(logging.INFO):
+                    # Guarded: get_full_name() runs even as a lazy %s arg
+                    logger.info("[OK] Created new patient profile for %s", user.get_full_name())
                 
-                # 3. Create Medical Record for this visit
-                medical_record = MedicalRecord.objects.create(
+                # 3. Create Medical Record for this visit; bulk_create
+                # emits one prepared INSERT without post_save dispatch
+                medical_record = MedicalRecord(
                     patient=patient,
+                    booking=instance,
                     visit_date=timezone.now(),
-                    chief_complaint=instance.notes or f"Scheduled appointment for {instance.service.name}",
-                    symptoms=f"Appointment Type: {instance.service.name}",
+                    chief_complaint=instance.notes or f"Scheduled appointment for {service.name}",
+                    symptoms=f"Appointment Type: {service.name}",
                     diagnosis="Consultation completed",
                     treatment_plan="As prescribed by the doctor",
                     created_by=instance.created_by,
                 )
-                logger.info(f"[OK] Created medical record #{medical_record.id} for {patient}")
+                MedicalRecord.objects.bulk_create([medical_record])
+                # %s defers patient.__str__ (and its user lookup) until a
+                # handler actually formats the record
+                logger.info("[OK] Created medical record #%s for %s", medical_record.id, patient)
                 
-                # 4. Create Billing (only when consultation is Done)
-                # Use get_or_create to prevent duplicate billings
+                # 4. Create Billing (only when consultation is Done).
+                # ignore_conflicts turns this into INSERT .. ON CONFLICT DO
+                # NOTHING against the OneToOneField's unique constraint: one
+                # round-trip in the common no-billing-yet case, instead of
+                # get_or_create's SELECT-then-INSERT
                 from django.conf import settings
-                default_fee = getattr(settings, 'DEFAULT_SERVICE_FEE', 500.00)
-                
-                # Determine service fee
-                service_fee = default_fee
-                if instance.service and hasattr(instance.service, 'price') and instance.service.price > 0:
-                    service_fee = float(instance.service.price)
-                
-                billing, billing_created = Billing.objects.get_or_create(
+                default_fee = getattr(settings, 'DEFAULT_SERVICE_FEE', Decimal('500.00'))
+
+                # Determine service fee; kept as Decimal end to end so no
+                # float noise leaks into the stored amounts
+                service_fee = Decimal(str(default_fee))
+                if service is not None and service.price > 0:
+                    service_fee = service.price
+
+                billing = Billing(
                     booking=instance,
-                    defaults={
-                        'service_fee': service_fee,
-                        'medicine_fee': 0.00,
-                        'additional_fee': 0.00,
-                        'discount': 0.00,
-                        'notes': f"Consultation fee for {instance.service.name if instance.service else 'General Consultation'}"
-                    }
+                    service_fee=service_fee,
+                    medicine_fee=Decimal('0.00'),
+                    additional_fee=Decimal('0.00'),
+                    discount=Decimal('0.00'),
+                    notes=f"Consultation fee for {service.name if service else 'General Consultation'}"
+                )
+                # bulk_create skips Billing.save(), so seed the opening
+                # balance the same way save() does for a new row
+                billing.balance = Decimal(_cents(service_fee)).scaleb(-2)
+                Billing.objects.bulk_create([billing], ignore_conflicts=True)
+
+                # ignore_conflicts suppresses RETURNING, so re-read the row
+                # whether this INSERT won or an earlier billing already existed
+                billing = Billing.objects.get(booking=instance)
+                logger.info(
+                    "[OK] Billing #%s in place with service fee PHP%s, total PHP%s",
+                    billing.id, service_fee, billing.total_amount
                 )
-                
-                if billing_created:
-                    logger.info(f"[OK] Created billing #{billing.id} with service fee PHP{service_fee}, total PHP{billing.total_amount}")
-                else:
-                    logger.info(f"[INFO] Billing already exists for booking #{instance.id}: #{billing.id}")
                 
                 # Update booking status to Completed
                 Booking.objects.filter(pk=instance.pk).update(status='Completed')
                 instance.status = 'Completed'
                 
-                logger.info(f"[OK] TRANSACTION COMPLETE: All records created for booking #{instance.id} after consultation completion")
+                logger.info("[OK] TRANSACTION COMPLETE: All records created for booking #%s after consultation completion", instance.id)
             
             # Clean up the flag
             delattr(instance, '_consultation_just_completed')
             
         except Exception as e:
-            logger.error(f"[ERROR] TRANSACTION FAILED: Error creating records for booking {instance.id}: {str(e)}")
+            logger.error("[ERROR] TRANSACTION FAILED: Error creating records for booking %s: %s", instance.id, e)
             # Transaction will be rolled back automatically
 
 
-@receiver(post_save, sender=Payment)
+@receiver(post_save, sender=Payment, dispatch_uid='bookings.update_billing_on_payment')
 def update_billing_on_payment(sender, instance, created, **kwargs):
     """
-    Update billing payment status whenever a payment is created or modified
+    Log billing updates for new payments.
+    Payment.save() already applies the payment delta to the billing with a
+    single F()-expression UPDATE, so re-aggregating here would double the work.
     """
     if created:
-        instance.billing.update_payment_status()
-        logger.info(f"Updated billing status after payment #{instance.id}")
+        logger.info("Updated billing status after payment #%s", instance.id)
 
 
-@receiver(post_save, sender=Billing)
+@receiver(post_save, sender=Billing, dispatch_uid='bookings.recalculate_billing_totals')
 def recalculate_billing_totals(sender, instance, created, **kwargs):
     """
     Recalculate billing totals when fees are updated
@@ -214,7 +319,7 @@ def recalculate_billing_totals(sender, instance, created, **kwargs):
                 delattr(instance, '_updating')
 
 
-@receiver(post_save, sender=Prescription)
+@receiver(post_save, sender=Prescription, dispatch_uid='bookings.update_billing_medicine_fee')
 def update_billing_medicine_fee(sender, instance, created, **kwargs):
     """
     Automatically update billing medicine fee when prescriptions are added
@@ -224,33 +329,33 @@ def update_billing_medicine_fee(sender, instance, created, **kwargs):
         try:
             with transaction.atomic():
                 # Get the booking associated with this medical record
+                # (direct FK when present, email scan for legacy rows)
                 medical_record = instance.medical_record
-                patient = medical_record.patient
-                
-                # Find the most recent booking for this patient
-                booking = Booking.objects.filter(
-                    patient_email=patient.user.email,
-                    status__in=['Confirmed', 'Completed']
-                ).order_by('-date', '-time').first()
-                
+                booking = _booking_with_billing(medical_record)
+
                 if booking and hasattr(booking, 'billing'):
-                    # Calculate total prescription cost
-                    total_prescription_cost = sum(
-                        prescription.total_price
-                        for prescription in medical_record.prescriptions.all()
+                    # Sum prescription cost in the database instead of
+                    # loading every row
+                    total_prescription_cost = Prescription.total_for_record(
+                        medical_record.pk
                     )
-                    
-                    # Update billing
+
+                    # Update billing with a queryset update() so the
+                    # Billing post_save handler doesn't re-enter; then
+                    # recompute balance/is_paid exactly once
                     billing = booking.billing
+                    Billing.objects.filter(pk=billing.pk).update(
+                        medicine_fee=total_prescription_cost
+                    )
                     billing.medicine_fee = total_prescription_cost
-                    billing.save()
-                    
-                    logger.info(f"✅ Updated billing #{billing.id} medicine fee to ₱{total_prescription_cost}")
+                    billing.update_payment_status()
+
+                    logger.info("✅ Updated billing #%s medicine fee to ₱%s", billing.id, total_prescription_cost)
         except Exception as e:
-            logger.error(f"❌ Error updating billing for prescription: {str(e)}")
+            logger.error("❌ Error updating billing for prescription: %s", e)
 
 
-@receiver(post_delete, sender=Prescription)
+@receiver(post_delete, sender=Prescription, dispatch_uid='bookings.update_billing_on_prescription_delete')
 def update_billing_on_prescription_delete(sender, instance, **kwargs):
     """
     Update billing when a prescription is deleted
@@ -258,28 +363,28 @@ def update_billing_on_prescription_delete(sender, instance, **kwargs):
     """
     try:
         with transaction.atomic():
+            # Direct FK when present, email scan for legacy rows
             medical_record = instance.medical_record
-            patient = medical_record.patient
-            
-            # Find the most recent booking for this patient
-            booking = Booking.objects.filter(
-                patient_email=patient.user.email,
-                status__in=['Confirmed', 'Completed']
-            ).order_by('-date', '-time').first()
-            
+            booking = _booking_with_billing(medical_record)
+
             if booking and hasattr(booking, 'billing'):
-                # Recalculate total prescription cost
-                total_prescription_cost = sum(
-                    prescription.total_price
-                    for prescription in medical_record.prescriptions.all()
+                # Recalculate total prescription cost in the database,
+                # excluding the row being deleted in case it is still
+                # visible to this transaction
+                total_prescription_cost = Prescription.total_for_record(
+                    medical_record.pk, exclude_pk=instance.pk
                 )
-                
-                # Update billing
+
+                # Queryset update() so the Billing post_save handler
+                # doesn't re-enter; then recompute balance/is_paid once
                 billing = booking.billing
+                Billing.objects.filter(pk=billing.pk).update(
+                    medicine_fee=total_prescription_cost
+                )
                 billing.medicine_fee = total_prescription_cost
-                billing.save()
-                
-                logger.info(f"✅ Updated billing #{billing.id} after prescription deletion")
+                billing.update_payment_status()
+
+                logger.info("✅ Updated billing #%s after prescription deletion", billing.id)
     except Exception as e:
-        logger.error(f"❌ Error updating billing after prescription deletion: {str(e)}")
+        logger.error("❌ Error updating billing after prescription deletion: %s", e)
 
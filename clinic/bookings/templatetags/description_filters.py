@@ -1,10 +1,112 @@
+import re
+from functools import lru_cache
+
 from django import template
 from django.utils.safestring import mark_safe
 from django.utils.html import escape
-import re
 
 register = template.Library()
 
+# Bullet markers recognised at the start of a list line (common bullet
+# chars and hyphen/star); the tuple feeds a C-level str.startswith test
+_BULLET_PREFIX = ('•', '‣', '◦', '-', '*', '․', '⁃')
+
+# Characters making up a bullet prefix (markers plus surrounding
+# whitespace), for stripping it without entering the regex engine
+_BULLET_CHARSET = frozenset(' \t•‣◦-*․⁃')
+
+# Splits text into paragraph blocks at blank (or whitespace-only) lines;
+# \s absorbs stray \r so CRLF input needs no prior normalization
+_PARA_SPLIT = re.compile(r'\n\s*\n')
+
+# Characters django's escape() would replace; one C-level search decides
+# whether its five str.replace passes are needed at all
+_NEEDS_ESCAPE = re.compile(r'[<>&"\']')
+
+
+def _fast_escape(s):
+    """escape() only when the string actually contains an escapable char"""
+    return s if _NEEDS_ESCAPE.search(s) is None else escape(s)
+
+
+def _strip_bullet(line):
+    """Drop the leading bullet marker/whitespace run and trim the rest"""
+    i = 0
+    n = len(line)
+    while i < n and line[i] in _BULLET_CHARSET:
+        i += 1
+    return line[i:].strip()
+
+
+@lru_cache(maxsize=256)
+def _render_description(value):
+    """Render a description to a plain HTML str (memoized).
+
+    Descriptions change rarely but are re-rendered on every page load;
+    the cache returns the finished markup on repeat inputs. It holds
+    plain str, never SafeString - the filter re-applies mark_safe on
+    the way out.
+    """
+    # Fast path for the dominant shape: a single line with no bullet
+    # marker renders as one paragraph without the block machinery. Kept
+    # to one line only - multi-line input needs the per-line bullet scan
+    # anyway, and a looser guard would misrender "Header:\n- item".
+    if '\n' not in value and '\r' not in value:
+        stripped = value.strip()
+        if not stripped:
+            return ''
+        if not stripped.startswith(_BULLET_PREFIX):
+            return '<p>' + _fast_escape(stripped) + '</p>'
+
+    # Block grouping runs in the C regex engine: one split at blank
+    # lines, then splitlines() per block (handles \r, \r\n and \n). The
+    # filters drop whitespace-only blocks/lines the way the old manual
+    # loop did.
+    blocks = [
+        [ln for ln in b.splitlines() if ln and not ln.isspace()]
+        for b in _PARA_SPLIT.split(value)
+        if b and not b.isspace()
+    ]
+
+    out_parts = []
+    # Bind the hot-loop callables to locals: index loads instead of a
+    # dict probe per call on long descriptions
+    append = out_parts.append
+    _escape = _fast_escape
+
+    for block in blocks:
+        # Partition the block in one pass (the old code scanned it with
+        # the regex up to three times: once per comprehension plus the
+        # all(...) re-check)
+        bullet_lines = []
+        non_bullet_lines = []
+        for line in block:
+            # startswith on a tuple is far cheaper than a regex for the
+            # yes/no decision; _strip_bullet drops the prefix later. This
+            # also stops lines that are merely indented from being
+            # mistaken for bullets.
+            (bullet_lines if line.lstrip().startswith(_BULLET_PREFIX)
+             else non_bullet_lines).append(line)
+
+        # Mixed block like "This is for:\n• item1\n• item2": paragraph
+        # first, then the list. Tags go into the list as constants and
+        # escaped text as its own element - no per-line f-string
+        # formatting; the single join at the end assembles everything
+        if non_bullet_lines:
+            paragraph = ' '.join([ln.strip() for ln in non_bullet_lines])
+            append('<p>')
+            append(_escape(paragraph))
+            append('</p>')
+        if bullet_lines:
+            append('<ul>')
+            for line in bullet_lines:
+                append('<li>')
+                append(_escape(_strip_bullet(line)))
+                append('</li>')
+            append('</ul>')
+
+    return ''.join(out_parts)
+
 
 @register.filter(is_safe=True)
 def format_service_description(value):
@@ -16,60 +118,9 @@ def format_service_description(value):
 
     This keeps output predictable for admin-entered plain text descriptions.
     """
-    if not value:
+    # isspace() is one C call and skips the whole pipeline (and a cache
+    # slot) for blank optional descriptions on list pages
+    if not value or value.isspace():
         return ''
-
-    # Normalize line endings
-    text = value.replace('\r\n', '\n').replace('\r', '\n')
-
-    lines = text.split('\n')
-
-    # Group into blocks separated by blank lines
-    blocks = []
-    current = []
-    for line in lines:
-        if line.strip() == '':
-            if current:
-                blocks.append(current)
-                current = []
-        else:
-            current.append(line)
-    if current:
-        blocks.append(current)
-
-    out_parts = []
-
-    # Regex to detect bullet/list lines (common bullet chars and hyphen/star)
-    bullet_re = re.compile(r'^[\s\u2022\u2023\u25E6\-\*\u2024\u2043]+')
-
-    for block in blocks:
-        # Check if this block has a mix of header + bullets (like "This is for:\n• item1\n• item2")
-        bullet_lines = [line for line in block if bullet_re.match(line)]
-        non_bullet_lines = [line for line in block if not bullet_re.match(line)]
-        
-        # If we have both bullet and non-bullet lines in the same block
-        if bullet_lines and non_bullet_lines:
-            # Render non-bullet lines as a paragraph first
-            if non_bullet_lines:
-                paragraph = ' '.join([ln.strip() for ln in non_bullet_lines])
-                out_parts.append(f'<p>{escape(paragraph)}</p>')
-            # Then render bullet lines as a list
-            if bullet_lines:
-                out_parts.append('<ul>')
-                for line in bullet_lines:
-                    item_text = bullet_re.sub('', line).strip()
-                    out_parts.append(f'<li>{escape(item_text)}</li>')
-                out_parts.append('</ul>')
-        # If all lines in the block look like a list item, render a ul
-        elif all(bullet_re.match(line) for line in block):
-            out_parts.append('<ul>')
-            for line in block:
-                item_text = bullet_re.sub('', line).strip()
-                out_parts.append(f'<li>{escape(item_text)}</li>')
-            out_parts.append('</ul>')
-        else:
-            # Normal paragraph: join lines into one paragraph
-            paragraph = ' '.join([ln.strip() for ln in block])
-            out_parts.append(f'<p>{escape(paragraph)}</p>')
-
-    return mark_safe('\n'.join(out_parts))
+    # str() folds SafeString/lazy inputs onto one cache key per text
+    return mark_safe(_render_description(str(value)))
@@ -0,0 +1,86 @@
+"""
+Plain builders for test fixtures.
+
+factory_boy-style defaults without the dependency (it isn't in
+requirements.txt): each helper returns an UNSAVED instance with
+sensible defaults, so callers can flush dependency-free rows in one
+round trip with bulk_create - or call .save() where signal behavior is
+under test. Override any field by keyword.
+"""
+from datetime import date, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from bookings.models import Service, Patient, Booking, MedicalRecord, Billing
+
+
+def build_user(**overrides):
+    """Unsaved User; no password, so no hashing (tests use force_login)"""
+    fields = dict(username='testuser')
+    fields.update(overrides)
+    return User(**fields)
+
+
+def build_service(**overrides):
+    fields = dict(
+        name='Test Service',
+        description='Test description',
+        price=Decimal('500.00'),
+    )
+    fields.update(overrides)
+    if 'image' not in fields:
+        fields['image'] = SimpleUploadedFile(
+            name='test.jpg', content=b'', content_type='image/jpeg'
+        )
+    return Service(**fields)
+
+
+def build_patient(user, **overrides):
+    fields = dict(
+        user=user,
+        date_of_birth=date(1990, 1, 1),
+        phone='+639123456789',
+    )
+    fields.update(overrides)
+    return Patient(**fields)
+
+
+def build_booking(service, **overrides):
+    fields = dict(
+        service=service,
+        patient_name='Test Patient',
+        patient_email='patient@test.com',
+        patient_phone='09123456789',
+        date=date.today() + timedelta(days=1),
+        time=time(10, 0),
+        status='Pending',
+    )
+    fields.update(overrides)
+    return Booking(**fields)
+
+
+def build_medical_record(patient, **overrides):
+    from django.utils import timezone
+    fields = dict(
+        patient=patient,
+        visit_date=timezone.now(),
+        chief_complaint='Test complaint',
+    )
+    fields.update(overrides)
+    return MedicalRecord(**fields)
+
+
+def build_billing(booking, **overrides):
+    fields = dict(
+        booking=booking,
+        service_fee=Decimal('500.00'),
+        medicine_fee=Decimal('0.00'),
+    )
+    fields.update(overrides)
+    if 'balance' not in fields:
+        # Billing.save() seeds the balance for new rows; bulk_create
+        # bypasses save(), so mirror that here
+        fields['balance'] = fields['service_fee'] + fields['medicine_fee']
+    return Billing(**fields)
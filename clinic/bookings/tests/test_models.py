@@ -47,18 +47,17 @@ class PatientModelTest(TestCase):
     """Test Patient model"""
     
     def setUp(self):
-        self.staff_user = User.objects.create_user(
-            username='staff',
-            password='pass',
-            is_staff=True
-        )
-        self.user = User.objects.create_user(
-            username='testpatient',
-            email='patient@test.com',
-            password='testpass123',
-            first_name='John',
-            last_name='Doe'
-        )
+        # One multi-row INSERT for the two users instead of two round
+        # trips; neither ever logs in, so no password is set
+        self.staff_user, self.user = User.objects.bulk_create([
+            User(username='staff', is_staff=True),
+            User(
+                username='testpatient',
+                email='patient@test.com',
+                first_name='John',
+                last_name='Doe'
+            ),
+        ])
         self.patient = Patient.objects.create(
             user=self.user,
             date_of_birth=date(1990, 1, 1),
@@ -90,7 +89,6 @@ class BookingModelTest(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
             username='staff',
-            password='testpass123',
             is_staff=True
         )
         self.service = Service.objects.create(
@@ -127,12 +125,68 @@ class BookingModelTest(TestCase):
         expected = f"Jane Smith - {self.booking.date} {self.booking.time} ({self.booking.status})"
         self.assertEqual(str(self.booking), expected)
 
+    def test_slot_collision_raises_validation_error(self):
+        """Test double-booking a slot surfaces as ValidationError, not IntegrityError"""
+        duplicate = Booking(
+            patient_name='John Smith',
+            patient_email='john@test.com',
+            patient_phone='09987654321',
+            service=self.service,
+            date=self.booking.date,
+            time=self.booking.time,
+            status='Pending',
+            created_by=self.user
+        )
+        with self.assertRaises(ValidationError):
+            duplicate.save()
+        # The savepoint inside save() must leave the surrounding
+        # transaction usable after the constraint violation
+        self.assertEqual(Booking.objects.count(), 1)
+
+
+class BookingListQuerySetTest(TestCase):
+    """Test BookingQuerySet.for_list_view"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='staff',
+            is_staff=True
+        )
+        self.service = Service.objects.create(
+            name='Consultation',
+            description='General consultation',
+            price=Decimal('500.00')
+        )
+        # Bookings in distinct slots, each with a billing record; two
+        # multi-row INSERTs instead of six round trips (bulk_create
+        # returns the instances with PKs on SQLite and Postgres)
+        bookings = Booking.objects.bulk_create([
+            Booking(
+                patient_name='Jane Smith',
+                patient_email='jane@test.com',
+                patient_phone='09123456789',
+                service=self.service,
+                date=date.today() + timedelta(days=1),
+                time=time(hour, 0),
+                created_by=self.user
+            )
+            for hour in range(9, 12)
+        ])
+        Billing.objects.bulk_create([Billing(booking=b) for b in bookings])
+
+    def test_for_list_view_single_query(self):
+        """Rendering list rows (service + billing) must not add per-row queries"""
+        with self.assertNumQueries(1):
+            for booking in Booking.objects.for_list_view():
+                self.assertEqual(booking.service.name, 'Consultation')
+                self.assertFalse(booking.billing.is_paid)
+
 
 class MedicalRecordModelTest(TestCase):
     """Test MedicalRecord model"""
     
     def setUp(self):
-        user = User.objects.create_user('patient', 'p@test.com', 'pass')
+        user = User.objects.create_user('patient', 'p@test.com')
         self.patient = Patient.objects.create(
             user=user,
             date_of_birth=date(1985, 5, 15),
@@ -164,7 +218,7 @@ class BillingModelTest(TestCase):
     def setUp(self):
         from django.core.files.uploadedfile import SimpleUploadedFile
         image = SimpleUploadedFile(name='test.jpg', content=b'', content_type='image/jpeg')
-        user = User.objects.create_user('staff', 's@test.com', 'pass', is_staff=True)
+        user = User.objects.create_user('staff', 's@test.com', is_staff=True)
         service = Service.objects.create(name='Test Service', description='Test', image=image, price=Decimal('1000.00'))
         self.booking = Booking.objects.create(
             patient_name='Test Patient',
@@ -192,6 +246,14 @@ class BillingModelTest(TestCase):
         """Test total amount is calculated correctly"""
         expected_total = Decimal('1250.00')  # 1000 + 200 + 50
         self.assertEqual(self.billing.total_amount, expected_total)
+
+    def test_cents_rounds_instead_of_truncating(self):
+        """Test centavo conversion survives float binary noise"""
+        from bookings.models.billing import _cents
+        self.assertEqual(_cents(Decimal('19.99')), 1999)
+        self.assertEqual(_cents(19.99), 1999)  # float repr, not 19.98
+        self.assertEqual(_cents(1.13), 113)    # 1.13 * 100 == 112.99...
+        self.assertEqual(_cents(None), 0)
     
     def test_billing_balance_calculation(self):
         """Test balance is calculated correctly"""
@@ -264,7 +326,7 @@ class POSSaleModelTest(TestCase):
     """Test POSSale model"""
     
     def setUp(self):
-        self.user = User.objects.create_user('staff', 's@test.com', 'pass', is_staff=True)
+        self.user = User.objects.create_user('staff', 's@test.com', is_staff=True)
         self.inventory = Inventory.objects.create(
             name='Test Product',
             description='Test Description',
@@ -313,8 +375,10 @@ class PrescriptionModelTest(TestCase):
     """Test Prescription model"""
     
     def setUp(self):
-        user = User.objects.create_user('patient', 'p@test.com', 'pass')
-        doctor = User.objects.create_user('doctor', 'd@test.com', 'pass', is_staff=True)
+        user, doctor = User.objects.bulk_create([
+            User(username='patient', email='p@test.com'),
+            User(username='doctor', email='d@test.com', is_staff=True),
+        ])
         patient = Patient.objects.create(
             user=user,
             date_of_birth=date(1990, 1, 1),
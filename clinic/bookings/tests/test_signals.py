@@ -0,0 +1,38 @@
+"""
+Tests for signal registration
+Guards against handlers being connected more than once (each duplicate
+registration multiplies the work done per save)
+"""
+from django.db.models.signals import post_save, pre_save
+from django.test import SimpleTestCase
+
+from bookings import signals
+from bookings.models import Booking
+
+
+class SignalRegistrationTest(SimpleTestCase):
+    """dispatch_uid keeps every handler registered exactly once"""
+
+    def _booking_receiver_counts(self):
+        sync_pre, _ = pre_save._live_receivers(Booking)
+        sync_post, _ = post_save._live_receivers(Booking)
+        return len(sync_pre), len(sync_post)
+
+    def test_booking_has_one_handler_per_signal(self):
+        self.assertEqual(self._booking_receiver_counts(), (1, 1))
+
+    def test_reconnecting_does_not_duplicate_receivers(self):
+        # Repeat the connects AppConfig.ready() performs; dispatch_uid
+        # must dedup them instead of stacking a second handler
+        before = self._booking_receiver_counts()
+        pre_save.connect(
+            signals.check_booking_confirmation,
+            sender=Booking,
+            dispatch_uid='bookings.check_booking_confirmation'
+        )
+        post_save.connect(
+            signals.create_appointment_or_patient_records,
+            sender=Booking,
+            dispatch_uid='bookings.create_appointment_or_patient_records'
+        )
+        self.assertEqual(self._booking_receiver_counts(), before)
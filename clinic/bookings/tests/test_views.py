@@ -2,26 +2,48 @@
 Unit tests for bookings views
 Tests authentication, CRUD operations, and HTMX endpoints
 """
-from django.test import TestCase, Client
+from django.conf import settings
+from django.test import TestCase, Client, RequestFactory
 from django.urls import reverse
 from django.contrib.auth.models import User
 from datetime import date, time, timedelta
 from decimal import Decimal
 
-from bookings.models import Service, Patient, Booking, Inventory, POSSale
+from bookings.models import Service, Patient, Booking, Inventory, POSSale, MedicalRecord, Billing
 
 
-class AuthenticationViewsTest(TestCase):
+class SharedSessionMixin:
+    """Log the class user in once instead of per test.
+
+    force_login writes a session row every time; building the session in
+    setUpTestData and reattaching its cookie saves that INSERT in each
+    test that needs an authenticated client.
+    """
+
+    @classmethod
+    def _login_cookie(cls, user):
+        client = Client()
+        client.force_login(user)
+        return client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def login_shared(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self._session_cookie
+
+
+class AuthenticationViewsTest(SharedSessionMixin, TestCase):
     """Test authentication views"""
     
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # Created once per class instead of per test; each test sees a
+        # fresh in-memory copy
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@test.com',
             password='testpass123',
             is_staff=True
         )
+        cls._session_cookie = cls._login_cookie(cls.user)
     
     def test_login_page_loads(self):
         """Test login page is accessible"""
@@ -49,7 +71,7 @@ class AuthenticationViewsTest(TestCase):
     
     def test_logout_redirects_to_login(self):
         """Test logout functionality"""
-        self.client.force_login(self.user)
+        self.login_shared()
         response = self.client.post(reverse('bookings_v2:logout'))
         self.assertEqual(response.status_code, 302)
 
@@ -57,11 +79,11 @@ class AuthenticationViewsTest(TestCase):
 class PublicViewsTest(TestCase):
     """Test public-facing views"""
     
-    def setUp(self):
-        self.client = Client()
+    @classmethod
+    def setUpTestData(cls):
         from django.core.files.uploadedfile import SimpleUploadedFile
         image = SimpleUploadedFile(name='test.jpg', content=b'', content_type='image/jpeg')
-        self.service = Service.objects.create(
+        cls.service = Service.objects.create(
             name='Eye Exam',
             description='Comprehensive eye examination',
             image=image,
@@ -85,33 +107,46 @@ class PublicViewsTest(TestCase):
         self.assertEqual(response.status_code, 200)
 
 
-class BookingViewsTest(TestCase):
-    """Test booking management views"""
-    
-    def setUp(self):
-        self.client = Client()
-        self.staff_user = User.objects.create_user(
+class StaffFixtureMixin(SharedSessionMixin):
+    """Canonical staff user + pre-built session for staff-only view tests.
+
+    Subclasses extend setUpTestData with their own objects via
+    super().setUpTestData().
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = User.objects.create_user(
             username='staff',
             password='staffpass123',
             is_staff=True
         )
+        cls._session_cookie = cls._login_cookie(cls.staff_user)
+
+
+class BookingViewsTest(StaffFixtureMixin, TestCase):
+    """Test booking management views"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         from django.core.files.uploadedfile import SimpleUploadedFile
         image = SimpleUploadedFile(name='test.jpg', content=b'', content_type='image/jpeg')
-        self.service = Service.objects.create(
+        cls.service = Service.objects.create(
             name='Skin Consultation',
             description='Dermatology consultation',
             image=image,
             price=Decimal('800.00')
         )
-        self.booking = Booking.objects.create(
+        cls.booking = Booking.objects.create(
             patient_name='Test Patient',
             patient_email='patient@test.com',
             patient_phone='09123456789',
-            service=self.service,
+            service=cls.service,
             date=date.today() + timedelta(days=1),
             time=time(10, 0),
             status='Pending',
-            created_by=self.staff_user
+            created_by=cls.staff_user
         )
     
     def test_admin_dashboard_requires_authentication(self):
@@ -121,42 +156,42 @@ class BookingViewsTest(TestCase):
     
     def test_admin_dashboard_loads_for_authenticated_user(self):
         """Test admin dashboard loads for logged-in staff"""
-        self.client.force_login(self.staff_user)
-        response = self.client.get(reverse('bookings_v2:admin_dashboard'))
+        # Status-only assertion: call the view directly and skip the
+        # full middleware/URL-resolution round trip
+        from bookings.views_v2 import admin_dashboard_v2
+        request = RequestFactory().get(reverse('bookings_v2:admin_dashboard'))
+        request.user = self.staff_user
+        response = admin_dashboard_v2(request)
         self.assertEqual(response.status_code, 200)
     
     def test_htmx_appointments_list(self):
         """Test HTMX appointments endpoint"""
-        self.client.force_login(self.staff_user)
+        self.login_shared()
         response = self.client.get(reverse('bookings_v2:htmx_appointments_list'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Patient')
 
 
-class PatientViewsTest(TestCase):
+class PatientViewsTest(StaffFixtureMixin, TestCase):
     """Test patient management views"""
     
-    def setUp(self):
-        self.client = Client()
-        self.staff_user = User.objects.create_user(
-            username='staff',
-            password='staffpass123',
-            is_staff=True
-        )
-        self.patient_user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.patient_user = User.objects.create_user(
             username='patient',
             email='patient@test.com',
             password='patientpass123',
             first_name='Jane',
             last_name='Doe'
         )
-        self.patient = Patient.objects.create(
-            user=self.patient_user,
+        cls.patient = Patient.objects.create(
+            user=cls.patient_user,
             date_of_birth=date(1995, 3, 15),
             gender='F',
             phone='+639123456789',
             address='123 Test St',
-            created_by=self.staff_user
+            created_by=cls.staff_user
         )
     
     def test_htmx_patients_list_requires_staff_login(self):
@@ -166,31 +201,27 @@ class PatientViewsTest(TestCase):
     
     def test_htmx_patients_list_loads_for_staff(self):
         """Test patient list displays for staff users"""
-        self.client.force_login(self.staff_user)
+        self.login_shared()
         response = self.client.get(reverse('bookings_v2:htmx_patients_list'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Jane Doe')
     
     def test_htmx_patient_detail_view(self):
         """Test patient detail view shows patient info"""
-        self.client.force_login(self.staff_user)
+        self.login_shared()
         response = self.client.get(reverse('bookings_v2:htmx_patient_detail', args=[self.patient.id]))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Jane Doe')
         self.assertContains(response, '+639123456789')
 
 
-class InventoryViewsTest(TestCase):
+class InventoryViewsTest(StaffFixtureMixin, TestCase):
     """Test inventory management views"""
     
-    def setUp(self):
-        self.client = Client()
-        self.staff_user = User.objects.create_user(
-            username='staff',
-            password='staffpass123',
-            is_staff=True
-        )
-        self.inventory_item = Inventory.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.inventory_item = Inventory.objects.create(
             name='Test Medicine',
             description='Test Description',
             category='Medicine',
@@ -205,23 +236,19 @@ class InventoryViewsTest(TestCase):
     
     def test_htmx_inventory_list_loads_for_staff(self):
         """Test inventory list displays items"""
-        self.client.force_login(self.staff_user)
+        self.login_shared()
         response = self.client.get(reverse('bookings_v2:htmx_inventory_list'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Medicine')
 
 
-class POSViewsTest(TestCase):
+class POSViewsTest(StaffFixtureMixin, TestCase):
     """Test Point of Sale views"""
     
-    def setUp(self):
-        self.client = Client()
-        self.staff_user = User.objects.create_user(
-            username='staff',
-            password='staffpass123',
-            is_staff=True
-        )
-        self.inventory = Inventory.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.inventory = Inventory.objects.create(
             name='Product',
             description='Test Product',
             category='Medicine',
@@ -236,22 +263,73 @@ class POSViewsTest(TestCase):
     
     def test_htmx_pos_interface_loads_for_staff(self):
         """Test POS page loads for staff users"""
-        self.client.force_login(self.staff_user)
-        response = self.client.get(reverse('bookings_v2:htmx_pos_interface'))
+        # Status-only assertion: direct view call via RequestFactory
+        from bookings.views_v2 import htmx_pos_interface
+        request = RequestFactory().get(reverse('bookings_v2:htmx_pos_interface'))
+        request.user = self.staff_user
+        response = htmx_pos_interface(request)
         self.assertEqual(response.status_code, 200)
 
 
-class DashboardViewsTest(TestCase):
-    """Test dashboard views"""
-    
-    def setUp(self):
-        self.client = Client()
-        self.staff_user = User.objects.create_user(
-            username='staff',
-            password='staffpass123',
-            is_staff=True
+class PatientDashboardViewsTest(SharedSessionMixin, TestCase):
+    """Test patient dashboard view"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from bookings.tests import factories
+        # Builders give the default field values; rows without mutual FK
+        # dependencies land in one bulk_create each
+        staff_user, cls.patient_user = User.objects.bulk_create([
+            factories.build_user(username='staff', is_staff=True),
+            factories.build_user(
+                username='patient',
+                email='patient@test.com',
+                first_name='Jane',
+                last_name='Doe'
+            ),
+        ])
+        cls._session_cookie = cls._login_cookie(cls.patient_user)
+        service = factories.build_service(name='Eye Exam')
+        service.save()
+        cls.patient = factories.build_patient(
+            cls.patient_user, created_by=staff_user
         )
-    
+        cls.patient.save()
+        cls.booking = factories.build_booking(
+            service,
+            patient_name='Jane Doe',
+            created_by=staff_user
+        )
+        cls.booking.save()
+        MedicalRecord.objects.bulk_create([
+            factories.build_medical_record(
+                cls.patient, chief_complaint='Blurred vision'
+            ),
+        ])
+        Billing.objects.bulk_create([factories.build_billing(cls.booking)])
+
+    def test_patient_dashboard_shows_own_data(self):
+        """Test dashboard lists the patient's bookings, records and bills"""
+        self.login_shared()
+        response = self.client.get(reverse('bookings_v2:patient_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(self.booking, response.context['upcoming_bookings'])
+        self.assertEqual(response.context['total_records'], 1)
+        self.assertEqual(len(response.context['unpaid_bills']), 1)
+
+    def test_patient_dashboard_query_count(self):
+        """Pin the dashboard's SQL footprint so N+1 regressions fail loudly"""
+        self.login_shared()
+        url = reverse('bookings_v2:patient_dashboard')
+        # Warm-up request so the count reflects steady-state rendering
+        self.client.get(url)
+        with self.assertNumQueries(13):
+            self.client.get(url)
+
+
+class DashboardViewsTest(StaffFixtureMixin, TestCase):
+    """Test dashboard views"""
+
     def test_admin_dashboard_requires_staff_login(self):
         """Test admin dashboard requires staff authentication"""
         response = self.client.get(reverse('bookings_v2:admin_dashboard'))
@@ -259,7 +337,17 @@ class DashboardViewsTest(TestCase):
     
     def test_admin_dashboard_loads_for_staff(self):
         """Test admin dashboard displays for staff"""
-        self.client.force_login(self.staff_user)
+        self.login_shared()
         response = self.client.get(reverse('bookings_v2:admin_dashboard'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Dashboard')
+
+    def test_admin_dashboard_query_count(self):
+        """Pin the dashboard's SQL footprint so N+1 regressions fail loudly"""
+        self.login_shared()
+        url = reverse('bookings_v2:admin_dashboard')
+        # Warm the process-local service/settings caches so the count
+        # reflects steady-state rendering
+        self.client.get(url)
+        with self.assertNumQueries(25):
+            self.client.get(url)
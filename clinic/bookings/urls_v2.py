@@ -13,6 +13,7 @@ from .views_v2 import (
     htmx_services_preview, htmx_time_slots, htmx_submit_booking, htmx_submit_contact,
     # Dashboard views
     htmx_dashboard_stats, htmx_financial_overview,
+    dashboard_bookings_json, dashboard_billings_json,
     # Billing views
     htmx_unpaid_patients, htmx_all_billings, htmx_mark_paid,
     htmx_paid_billings, htmx_unpaid_billings,
@@ -97,6 +98,8 @@ urlpatterns = [
     # Dashboard stats refresh endpoint
     path('htmx/dashboard-stats/', htmx_dashboard_stats, name='htmx_dashboard_stats'),
     path('htmx/financial-overview/', htmx_financial_overview, name='htmx_financial_overview'),
+    path('api/dashboard/bookings/', dashboard_bookings_json, name='dashboard_bookings_json'),
+    path('api/dashboard/billings/', dashboard_billings_json, name='dashboard_billings_json'),
     
     path('htmx/unpaid-patients/', htmx_unpaid_patients, name='htmx_unpaid_patients'),
     path('htmx/all-billings/', htmx_all_billings, name='htmx_all_billings'),
@@ -29,7 +29,7 @@ def log_activity(user, action, model_name, object_id=None, description='', reque
             else:
                 ip_address = request.META.get('REMOTE_ADDR')
         
-        ActivityLog.objects.create(
+        entry = ActivityLog(
             user=user,
             action=action,
             model_name=model_name,
@@ -37,7 +37,15 @@ def log_activity(user, action, model_name, object_id=None, description='', reque
             description=description,
             ip_address=ip_address
         )
-        
+
+        # Buffer on the request when ActivityLogBufferMiddleware is active so
+        # all entries for the request are flushed in one bulk_create
+        buffer = getattr(request, '_activity_buffer', None) if request else None
+        if buffer is not None:
+            buffer.append(entry)
+        else:
+            entry.save()
+
         logger.info(f"Activity logged: {user} - {action} {model_name} #{object_id}")
         return True
         
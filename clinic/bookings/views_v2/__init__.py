@@ -22,6 +22,8 @@ from .auth_views import (
 from .dashboard_views import (
     htmx_dashboard_stats,
     htmx_financial_overview,
+    dashboard_bookings_json,
+    dashboard_billings_json,
 )
 
 from .public_views import (
@@ -171,6 +173,8 @@ __all__ = [
     # Dashboard views (modularized)
     'htmx_dashboard_stats',
     'htmx_financial_overview',
+    'dashboard_bookings_json',
+    'dashboard_billings_json',
     
     # Public views (modularized)
     'home_v2',
@@ -4,15 +4,18 @@ Handles appointment lists, booking confirmations, and consultation status
 """
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.core.exceptions import ValidationError
 from django.http import HttpResponse
 from django.views.decorators.http import require_http_methods
 from django.contrib import messages
 from django.db.models import Q
 from django.core.paginator import Paginator
+from django.utils import timezone
 from datetime import date
 import logging
 
 from ..models import Booking, Service, Doctor
+from ..signals import create_appointment_or_patient_records
 from ..decorators import staff_required
 from ..utils.responses import htmx_error, htmx_success
 from ..utils.email_utils import send_booking_confirmation_email, send_booking_status_update_email
@@ -136,7 +139,8 @@ def htmx_mark_consultation_done(request, booking_id):
         booking = Booking.objects.select_related('service').get(id=booking_id)
         booking.consultation_status = 'Done'
         booking.status = 'Completed'
-        booking.save()
+        # Only the status columns change on this path
+        booking.save(update_fields=['consultation_status', 'status', 'updated_at'])
         
         logger.info(f"Consultation marked as done for booking #{booking_id} by {request.user.username}")
         
@@ -183,8 +187,8 @@ def htmx_update_consultation_status(request, booking_id):
         # If marking as no-show, mark booking as cancelled
         elif new_status == 'No-Show':
             booking.status = 'Cancelled'
-        
-        booking.save()
+
+        booking.save(update_fields=['consultation_status', 'status', 'updated_at'])
         
         logger.info(f"Consultation status updated to '{new_status}' for booking #{booking_id} by {request.user.username}")
         
@@ -229,8 +233,15 @@ def htmx_update_appointment_doctor(request, booking_id):
             except Doctor.DoesNotExist:
                 logger.warning(f"Invalid doctor ID {doctor_id} for booking #{booking_id}")
                 return htmx_error("Doctor not found or not available", status=400)
-        
-        booking.save()
+
+            # Doctor availability lives in Booking.clean(); save() no
+            # longer runs it, so check here on the assignment path
+            try:
+                booking.clean()
+            except ValidationError as exc:
+                return htmx_error(' '.join(exc.messages), status=400)
+
+        booking.save(update_fields=['doctor', 'updated_at'])
         
         # Get available doctors for the dropdown in the response
         available_doctors = Doctor.objects.filter(is_available=True).order_by('last_name', 'first_name')
@@ -263,7 +274,7 @@ def htmx_delete_appointment(request, booking_id):
         if has_records:
             # Soft delete: just mark as cancelled instead of hard delete
             booking.status = 'Cancelled'
-            booking.save()
+            booking.save(update_fields=['status', 'updated_at'])
             logger.info(f"Booking #{booking_id} cancelled (has medical records) by {request.user.username}")
         else:
             # Hard delete: completely remove the appointment
@@ -290,9 +301,9 @@ def htmx_delete_appointment(request, booking_id):
 def htmx_pending_bookings(request):
     """HTMX endpoint to list all pending bookings"""
     
-    pending_bookings = Booking.objects.filter(
+    pending_bookings = Booking.objects.for_list_view().filter(
         status='Pending'
-    ).select_related('service').order_by('date', 'time')
+    ).order_by('date', 'time')
     
     return render(request, 'bookings_v2/htmx_partials/pending_bookings.html', {
         'bookings': pending_bookings
@@ -306,14 +317,25 @@ def htmx_accept_booking(request, booking_id):
     """Accept a pending booking and create patient records"""
     try:
         booking = Booking.objects.get(id=booking_id, status='Pending')
-        
+
         # Store old status for email
         old_status = booking.status
-        
-        # Update booking status to Confirmed
+
+        # Conditional UPDATE instead of save(): the WHERE clause makes the
+        # transition atomic (only one concurrent accept flips the row) and
+        # the view already knows this is the Pending->Confirmed edge, so
+        # the pre_save old-row lookup and signal dispatch are skipped
+        updated = Booking.objects.filter(pk=booking.pk, status='Pending').update(
+            status='Confirmed', updated_at=timezone.now()
+        )
+        if not updated:
+            raise Booking.DoesNotExist
         booking.status = 'Confirmed'
-        booking.save()  # This triggers signals that create Patient, MedicalRecord, Billing
-        
+
+        # Run the post-confirmation logic (Appointment creation) directly
+        booking._booking_just_confirmed = True
+        create_appointment_or_patient_records(Booking, booking, created=False)
+
         # Send confirmation email
         email_sent = send_booking_status_update_email(booking, old_status, 'Confirmed')
         if email_sent:
@@ -377,10 +399,15 @@ def htmx_decline_booking(request, booking_id):
     try:
         booking = Booking.objects.get(id=booking_id, status='Pending')
         patient_name = booking.patient_name
-        
-        # Update status to Cancelled (or delete if preferred)
-        booking.status = 'Cancelled'
-        booking.save()
+
+        # Update status to Cancelled (or delete if preferred); a declined
+        # booking triggers no signal logic, so a conditional UPDATE is all
+        # this transition needs
+        updated = Booking.objects.filter(pk=booking.pk, status='Pending').update(
+            status='Cancelled', updated_at=timezone.now()
+        )
+        if not updated:
+            raise Booking.DoesNotExist
         
         # Return success message (row will be removed)
         response = HttpResponse(
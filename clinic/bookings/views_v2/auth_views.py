@@ -109,9 +109,9 @@ def patient_dashboard_v2(request):
             has_profile = False
     
     # Get patient's bookings by email - works even without Patient profile
-    bookings = Booking.objects.filter(
+    bookings = Booking.objects.for_list_view().filter(
         patient_email=request.user.email
-    ).select_related('service').order_by('-date', '-time')
+    ).order_by('-date', '-time')
     
     upcoming_bookings = bookings.filter(
         date__gte=date.today(),
@@ -123,32 +123,34 @@ def patient_dashboard_v2(request):
     ).exclude(status='Cancelled')
     
     # Initialize profile-specific data
-    medical_records = MedicalRecord.objects.none()
-    billings = Billing.objects.none()
+    medical_records = []
+    billings = []
     pos_sales = POSSale.objects.none()
-    unpaid_bills = Billing.objects.none()
+    unpaid_bills = []
     booking_outstanding = 0
-    
+
     # Only fetch patient-specific records if profile exists
     if has_profile and patient:
         # Get medical records with related images and prescriptions
-        medical_records = MedicalRecord.objects.filter(
+        medical_records = list(MedicalRecord.objects.filter(
             patient=patient
-        ).prefetch_related('images', 'prescriptions__medicine').order_by('-visit_date')
-        
-        # Get billing information from bookings
-        billings = Billing.objects.filter(
+        ).prefetch_related('images', 'prescriptions__medicine').order_by('-visit_date'))
+
+        # Get billing information from bookings; one fetch serves the
+        # full list, the unpaid subset and the outstanding total (the
+        # old filter + aggregate pair re-read the same rows twice)
+        billings = list(Billing.objects.filter(
             booking__patient_email=request.user.email
-        ).select_related('booking__service').order_by('-issued_date')
-        
+        ).select_related('booking__service').order_by('-issued_date'))
+
         # Get POS sales for this patient
         pos_sales = POSSale.objects.filter(
             patient=patient
         ).order_by('-sale_date')
-        
+
         # Calculate outstanding balance from bookings
-        unpaid_bills = billings.filter(is_paid=False)
-        booking_outstanding = unpaid_bills.aggregate(total=Sum('balance'))['total'] or 0
+        unpaid_bills = [b for b in billings if not b.is_paid]
+        booking_outstanding = sum(b.balance for b in unpaid_bills)
     
     # Calculate total outstanding including unpaid POS sales (if any are unpaid)
     # For now, POS sales are paid immediately, but we'll include for completeness
@@ -161,7 +163,7 @@ def patient_dashboard_v2(request):
         'past_bookings': past_bookings,
         'total_bookings': bookings.count(),
         'medical_records': medical_records,
-        'total_records': medical_records.count(),
+        'total_records': len(medical_records),
         'billings': billings,
         'pos_sales': pos_sales,
         'unpaid_bills': unpaid_bills,
@@ -4,12 +4,93 @@ Returns only the stats grid for auto-refresh functionality
 """
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
+from django.http import HttpResponse, JsonResponse
 from ..decorators import staff_required
-from datetime import date
+from datetime import date, datetime
 from django.db.models import Q, Sum, Count, F
 from django.db import models
 
-from ..models import Billing, Booking, Patient, MedicalRecord, Inventory
+from ..models import Billing, Booking, Patient, MedicalRecord, Inventory, LowStockView
+
+# orjson encodes date/time/Decimal-heavy row lists several times faster
+# than the stdlib encoder; fall back to JsonResponse when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _rows_response(payload):
+    """Serialize a JSON feed payload with orjson when available"""
+    if orjson is not None:
+        return HttpResponse(
+            orjson.dumps(payload, default=str),
+            content_type='application/json'
+        )
+    return JsonResponse(payload)
+
+
+def booking_dashboard_rows(date_from=None, date_to=None):
+    """
+    Raw-dict booking rows for high-volume dashboard/calendar feeds.
+    .values() skips model materialization entirely — no Booking instances,
+    no per-row Python property calls — which is the dominant cost once a
+    feed returns hundreds of rows.
+    """
+    qs = Booking.objects.order_by('-date', '-time')
+    if date_from:
+        qs = qs.filter(date__gte=date_from)
+    if date_to:
+        qs = qs.filter(date__lte=date_to)
+    return qs.values(
+        'id', 'patient_name', 'date', 'time', 'status',
+        'consultation_status', 'service__name',
+    )
+
+
+def billing_dashboard_rows(date_from=None, date_to=None):
+    """Raw-dict billing rows for dashboard feeds (see booking_dashboard_rows)"""
+    qs = Billing.objects.order_by('-issued_date')
+    if date_from:
+        qs = qs.filter(issued_date__date__gte=date_from)
+    if date_to:
+        qs = qs.filter(issued_date__date__lte=date_to)
+    return qs.annotate(patient_name=F('booking__patient_name')).values(
+        'id', 'patient_name', 'total_amount', 'amount_paid',
+        'balance', 'is_paid', 'issued_date',
+    )
+
+
+def _parse_date_param(value):
+    """Parse an optional YYYY-MM-DD query parameter, returning None on bad input"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+@login_required
+@staff_required
+def dashboard_bookings_json(request):
+    """JSON feed of booking rows for dashboard widgets"""
+    rows = booking_dashboard_rows(
+        date_from=_parse_date_param(request.GET.get('date_from')),
+        date_to=_parse_date_param(request.GET.get('date_to')),
+    )
+    return _rows_response({'results': list(rows)})
+
+
+@login_required
+@staff_required
+def dashboard_billings_json(request):
+    """JSON feed of billing rows for dashboard widgets"""
+    rows = billing_dashboard_rows(
+        date_from=_parse_date_param(request.GET.get('date_from')),
+        date_to=_parse_date_param(request.GET.get('date_to')),
+    )
+    return _rows_response({'results': list(rows)})
 
 
 @login_required
@@ -34,9 +115,7 @@ def htmx_dashboard_stats(request):
     total_patient_profiles = Patient.objects.count()
     
     total_inventory_items = Inventory.objects.count()
-    low_stock_items = Inventory.objects.filter(
-        quantity__lte=F('stock')
-    ).count()
+    low_stock_items = LowStockView.objects.count()
     out_of_stock_items = Inventory.objects.filter(quantity=0).count()
     
     total_billings = Billing.objects.count()
@@ -579,7 +579,11 @@ def htmx_pos_add_to_cart(request, item_id):
         )
         
         if not created:
-            # Item exists, increase quantity if stock allows
+            # Item exists, increase quantity if stock allows; hand the
+            # already-loaded rows to the descriptor caches so save()
+            # doesn't re-fetch the sale or inventory item
+            cart_item.sale = current_sale
+            cart_item.inventory_item = inventory_item
             if cart_item.quantity < inventory_item.quantity:
                 cart_item.quantity += 1
                 cart_item.save()
@@ -608,7 +612,7 @@ def htmx_pos_add_to_cart(request, item_id):
 def htmx_pos_remove_from_cart(request, item_id):
     """Remove item from cart"""
     try:
-        cart_item = POSSaleItem.objects.get(id=item_id)
+        cart_item = POSSaleItem.objects.select_related('sale').get(id=item_id)
         current_sale = cart_item.sale
         cart_item.delete()
         
@@ -632,7 +636,7 @@ def htmx_pos_remove_from_cart(request, item_id):
 def htmx_pos_update_quantity(request, item_id):
     """Update cart item quantity"""
     try:
-        cart_item = POSSaleItem.objects.get(id=item_id)
+        cart_item = POSSaleItem.objects.select_related('sale', 'inventory_item').get(id=item_id)
         action = request.GET.get('action', 'increase')
         
         if action == 'increase':
@@ -756,29 +760,19 @@ def htmx_pos_complete_sale(request, sale_id):
         # Save first to update all calculations
         current_sale.save()
         
-        # Now mark as completed and save again - this will trigger inventory deduction
+        # Now mark as completed - a narrow status-only UPDATE
         current_sale.status = 'Completed'
-        current_sale.save()
+        current_sale.save(update_fields=['status', 'updated_at'])
         
-        # Deduct inventory manually for each item
-        for item in current_sale.items.all():
-            # Deduct from inventory
-            if item.inventory_item.quantity >= item.quantity:
-                item.inventory_item.quantity -= item.quantity
-                item.inventory_item.save()
-                
-                # Create stock transaction
-                try:
-                    StockTransaction.objects.create(
-                        inventory_item=item.inventory_item,
-                        transaction_type='Stock Out',
-                        quantity=item.quantity,
-                        performed_by=request.user,
-                        notes=f"POS Sale - Receipt #{current_sale.receipt_number}"
-                    )
-                except Exception:
-                    # Silently continue if stock transaction creation fails
-                    pass
+        # Load the cart once with the inventory rows joined for the
+        # receipt rows below
+        cart_items = list(current_sale.items.select_related('inventory_item'))
+
+        # Deduct stock for the whole cart: one CASE UPDATE on Inventory
+        # plus one bulk INSERT of stock transactions. Deduction failures
+        # propagate - only the audit insert inside is allowed to fail
+        # quietly (it logs instead)
+        current_sale.apply_inventory_deductions(performed_by=request.user)
         
         # Generate receipt HTML
         receipt_html = f'''
@@ -809,7 +803,7 @@ def htmx_pos_complete_sale(request, sale_id):
                         <tbody>
         '''
         
-        for item in current_sale.items.all():
+        for item in cart_items:
             receipt_html += f'''
                             <tr>
                                 <td>{item.inventory_item.name}</td>
@@ -903,7 +897,7 @@ def htmx_pos_cancel_sale(request, sale_id):
     try:
         current_sale = POSSale.objects.get(id=sale_id, status='Pending')
         current_sale.status = 'Cancelled'
-        current_sale.save()
+        current_sale.save(update_fields=['status', 'updated_at'])
         
         # Create new pending sale
         new_sale = POSSale.objects.create(
@@ -1034,11 +1028,11 @@ def htmx_pos_sales_list(request):
 def htmx_pos_sale_detail(request, sale_id):
     """View detailed receipt for a sale"""
     try:
-        sale = POSSale.objects.get(id=sale_id)
-        
+        sale = POSSale.objects.select_related('patient__user', 'created_by').get(id=sale_id)
+
         context = {
             'sale': sale,
-            'items': sale.items.all()
+            'items': sale.items.select_related('inventory_item')
         }
         
         return render(request, 'bookings_v2/partials/pos_sale_detail.html', context)
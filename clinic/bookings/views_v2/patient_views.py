@@ -9,7 +9,7 @@ from django.http import HttpResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib import messages
-from django.db.models import Q
+from django.db.models import Q, Sum
 from django.core.paginator import Paginator
 from datetime import datetime, date
 import logging
@@ -173,16 +173,17 @@ def htmx_patient_detail(request, patient_id):
         
         # Calculate outstanding balance
         # Billing is linked to Booking, so we need to find billings through bookings
-        unpaid_billings = Billing.objects.filter(
+        # One aggregate query; the old exists() + Python sum fetched the
+        # rows twice just to add up a column
+        total_outstanding = Billing.objects.filter(
             booking__patient_name=patient_full_name,
             is_paid=False
-        )
-        total_outstanding = sum(billing.total_amount for billing in unpaid_billings) if unpaid_billings.exists() else 0
+        ).aggregate(total=Sum('total_amount'))['total'] or 0
         
         # Get recent appointments (last 5)
-        recent_appointments = Booking.objects.filter(
+        recent_appointments = Booking.objects.for_list_view().filter(
             patient_name=patient_full_name
-        ).select_related('service').order_by('-date', '-time')[:5]
+        ).order_by('-date', '-time')[:5]
         
         # Get recent medical records (last 3)
         recent_records = MedicalRecord.objects.filter(
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 from decouple import config, Csv, AutoConfig
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -57,6 +58,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'axes.middleware.AxesMiddleware',  # Must be after AuthenticationMiddleware
     'bookings.middleware.StaffPermissionMiddleware',
+    'bookings.middleware.ActivityLogBufferMiddleware',  # Batch audit-log INSERTs per request
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -97,6 +99,7 @@ DATABASES = {
         'PORT': config('DB_PORT', default='5432'),
         'ATOMIC_REQUESTS': True,  # Enable atomic requests for data integrity
         'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),  # Connection pooling (10 minutes)
+        'CONN_HEALTH_CHECKS': config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),  # Ping before reusing a pooled connection
         'OPTIONS': {
             'connect_timeout': 10,
             'options': '-c statement_timeout=30000',  # 30 second query timeout
@@ -107,6 +110,12 @@ DATABASES = {
     }
 }
 
+# Run tests against an in-memory SQLite database even when DB_NAME points
+# at a file; `manage.py test --parallel` then clones a per-worker copy in
+# RAM instead of on disk. (TestCase classes here are parallel-safe.)
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    DATABASES['default']['TEST'] = {'NAME': ':memory:'}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -126,6 +135,12 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Under the test runner, swap PBKDF2 (deliberately slow by design) for a
+# trivial hasher; the many create_user calls in fixtures dominate suite
+# runtime otherwise. Never active outside `manage.py test`.
+if 'test' in sys.argv:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -159,6 +174,12 @@ WHITENOISE_MAX_AGE = 31536000  # 1 year in seconds
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Point test uploads at a throwaway temp dir so SimpleUploadedFile
+# fixtures don't litter the real media tree on every run
+if 'test' in sys.argv:
+    import tempfile
+    MEDIA_ROOT = Path(tempfile.mkdtemp(prefix='clinic_test_media_'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 